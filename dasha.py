@@ -19,7 +19,7 @@ def setup_vedastro_time(date_str, time_str, offset_str, lat, lon, city):
     return Time(combined_time_str, geolocation)
 
 
-def generate_dasha_audit_file(config):
+def generate_dasha_audit_file(config, now_dt=None, output_file="2.dasha_payload.json", scan_step_days=20):
     # --- CONFIGURATION ---
     # Setup calculation times with Timezone offsets
     birth_time = setup_vedastro_time(
@@ -45,8 +45,9 @@ def generate_dasha_audit_file(config):
     # This creates the exact start point for the Dasha timeline
     start_dt = datetime.strptime(f"{dob_str} {tob_str}", "%d/%m/%Y %H:%M")
     
-    #`` Look-ahead: 8 years from today's date
-    now_dt = datetime.now()
+    #`` Look-ahead: 8 years from today's date (pinned by the caller for reproducible runs)
+    pinned_now = now_dt is not None
+    now_dt = now_dt or datetime.now()
     end_dt = datetime(now_dt.year + 8, now_dt.month, now_dt.day)    
 
 
@@ -82,10 +83,12 @@ def generate_dasha_audit_file(config):
     # --- TM-001 & TM-002: SEQUENTIAL SCAN ---
     dasha_sequence = []
     current_dt = start_dt
+    # Sub-day scan steps keep the time of day so boundaries can be compared to the minute
+    date_fmt = "%Y-%m-%d" if scan_step_days >= 1 else "%Y-%m-%d %H:%M"
     last_md, last_ad = "", ""
 
     while current_dt <= end_dt:
-        time_str = current_dt.strftime("%H:%M %d/%m/%Y {offset}")
+        time_str = current_dt.strftime(f"%H:%M %d/%m/%Y {offset}")
         target_time = Time(time_str, geolocation)
 
         try:
@@ -98,7 +101,7 @@ def generate_dasha_audit_file(config):
                 dasha_sequence.append({
                     "Level": "Mahadasha",
                     "Planet": md,
-                    "Start": current_dt.strftime("%Y-%m-%d")
+                    "Start": current_dt.strftime(date_fmt)
                 })
                 last_md = md
 
@@ -107,22 +110,30 @@ def generate_dasha_audit_file(config):
                     "Level": "Antardasha",
                     "Planet": ad,
                     "Parent": md,
-                    "Start": current_dt.strftime("%Y-%m-%d")
+                    "Start": current_dt.strftime(date_fmt)
                 })
                 last_ad = ad
         except:
             pass
         
-        current_dt += timedelta(days=20)
+        current_dt += timedelta(days=scan_step_days)
 
     # Post-process End Dates
     for i in range(len(dasha_sequence) - 1):
         dasha_sequence[i]["End"] = dasha_sequence[i+1]["Start"]
     if dasha_sequence:
-        dasha_sequence[-1]["End"] = end_dt.strftime("%Y-%m-%d")
+        dasha_sequence[-1]["End"] = end_dt.strftime(date_fmt)
 
     # --- TM-001: CURRENT SNAPSHOT ---
-    now_snap = Calculate.DasaForNow(birth_time, 3)
+    if pinned_now:
+        # A pinned now_dt is local to current_details (as regression.query_datetime builds it)
+        current = config["current_details"]
+        now_time = setup_vedastro_time(now_dt.strftime("%d/%m/%Y"), now_dt.strftime("%H:%M"), current["timezone_offset"],
+                                       current["location"]["latitude"], current["location"]["longitude"],
+                                       current["location"]["city"])
+        now_snap = Calculate.DasaAtTime(birth_time, now_time, 3)
+    else:
+        now_snap = Calculate.DasaForNow(birth_time, 3)
     md_now = list(now_snap.keys())[0]
     ad_now = list(now_snap[md_now]['SubDasas'].keys())[0]
     pd_now = list(now_snap[md_now]['SubDasas'][ad_now]['SubDasas'].keys())[0]
@@ -132,7 +143,8 @@ def generate_dasha_audit_file(config):
         "Metadata": {
             "UID_Reference": ["TM-001", "TM-002", "TM-003"],
             "Birth_Time": "1990-08-15T14:30:00+05:30",
-            "Current_Time": datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+            "Current_Time": now_dt.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "Scan_Step_Days": scan_step_days
         },
         "Dasha_Timeline": {
             "TM-001_Active_Period": {
@@ -145,10 +157,12 @@ def generate_dasha_audit_file(config):
         }
     }
 
-    with open("2.dasha_payload.json", "w") as f:
-        json.dump(audit_data, f, indent=2)
+    if output_file:
+        with open(output_file, "w") as f:
+            json.dump(audit_data, f, indent=2)
     
-    print("Success: dasha_audit_log.json generated with verified Atmakaraka.")
+        print("Success: dasha_audit_log.json generated with verified Atmakaraka.")
+    return audit_data
 
 if __name__ == "__main__":
        # Load inputs
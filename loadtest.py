@@ -0,0 +1,222 @@
+import sys
+import json
+import time
+import types
+import importlib
+import random
+import argparse
+import datetime
+import threading
+import tracemalloc
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Headless load test for the Streamlit dashboard. Streamlit serves every session from a
+# thread in one process, so each simulated session is a thread running mri_scan.run_mri_scan()
+# with randomized sidebar inputs, exactly as a rerun of app.py would.
+#
+#   python loadtest.py --sessions 20 --reruns 10                 # real VedAstro library
+#   python loadtest.py --backend stub --latency-ms 40 --cache    # latency-configurable stub
+#   python loadtest.py --backend stub --trace-memory             # adds a tracemalloc pass
+
+
+def install_stub_backend(latency_ms, time_latency_ms):
+    """
+    Registers a fake 'vedastro' module (same trick as the pkg_resources polyfill) so
+    mri_scan imports it instead of the real library. Every Calculate call sleeps
+    `latency_ms`, every Time() construction sleeps `time_latency_ms`.
+    """
+    stub = types.ModuleType("vedastro")
+    signs = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
+
+    def call(*args):
+        time.sleep(latency_ms / 1000)
+        return random.choice(signs)
+
+    class GeoLocation:
+        def __init__(self, name, lon, lat):
+            self.name, self.lon, self.lat = name, lon, lat
+
+    class Time:
+        def __init__(self, time_str, geolocation):
+            time.sleep(time_latency_ms / 1000)
+            self.time_str, self.geolocation = time_str, geolocation
+
+    class Calculate:
+        Tithi = staticmethod(call)
+        MoonNakshatra = staticmethod(call)
+        Yoga = staticmethod(call)
+        PlanetSign = staticmethod(call)
+
+    stub.GeoLocation = GeoLocation
+    stub.Time = Time
+    stub.Calculate = Calculate
+    stub.PlanetName = types.SimpleNamespace(**{p: p for p in ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu"]})
+    stub.__all__ = ["GeoLocation", "Time", "Calculate", "PlanetName"]
+    stub.is_loadtest_stub = True
+    sys.modules["vedastro"] = stub
+
+
+class ScanCache:
+    """LRU stand-in for st.cache_data around run_mri_scan, keyed by the sidebar inputs and the minute"""
+
+    def __init__(self, scan_func, max_entries=1000):
+        self.scan_func = scan_func
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, lat, lon, b_date, b_time, b_tz, now_dt):
+        key = (lat, lon, b_date, b_time, b_tz, now_dt.strftime("%Y-%m-%d %H:%M"))
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+        result = self.scan_func(lat, lon, b_date, b_time, b_tz, now_dt)
+        with self.lock:
+            self.entries[key] = result
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return result
+
+
+def random_sidebar(rng):
+    """What a user could type into app.py's sidebar"""
+    return {
+        "lat": round(rng.uniform(8.0, 35.0), 4),
+        "lon": round(rng.uniform(68.0, 97.0), 4),
+        "b_date": datetime.date(1950, 1, 1) + datetime.timedelta(days=rng.randrange(0, 365 * 55)),
+        "b_time": datetime.time(rng.randrange(24), rng.randrange(60)),
+        "b_tz": rng.choice(["+05:30", "+05:30", "+05:30", "+05:45", "+00:00"]),
+    }
+
+
+def run_session(session_id, scan, reruns, change_prob, think_ms, seed):
+    """
+    One simulated user. The first rerun uses fresh inputs; every later rerun changes the
+    inputs with probability `change_prob` (otherwise it is a plain widget-triggered rerun).
+    """
+    rng = random.Random(seed + session_id)
+    inputs = random_sidebar(rng)
+    latencies, errors = [], 0
+    cpu_start = time.thread_time()
+
+    for i in range(reruns):
+        if i > 0 and rng.random() < change_prob:
+            inputs = random_sidebar(rng)
+        start = time.perf_counter()
+        try:
+            scan(inputs["lat"], inputs["lon"], inputs["b_date"], inputs["b_time"], inputs["b_tz"], datetime.datetime.now())
+        except Exception:
+            errors += 1
+        latencies.append((time.perf_counter() - start) * 1000)
+        if think_ms:
+            time.sleep(think_ms / 1000)
+
+    return {"Session": session_id, "Latencies_ms": latencies, "CPU_s": time.thread_time() - cpu_start, "Errors": errors}
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    idx = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def run_sessions(scan, sessions, reruns, change_prob, think_ms, seed):
+    """All sessions concurrently, one thread each. Returns (per-session results, wall seconds)"""
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        results = list(pool.map(lambda s: run_session(s, scan, reruns, change_prob, think_ms, seed), range(sessions)))
+    return results, time.perf_counter() - wall_start
+
+
+def run_load_test(sessions=10, reruns=5, backend="real", latency_ms=20.0, time_latency_ms=5.0,
+                  use_cache=False, change_prob=0.3, think_ms=0.0, seed=0, trace_memory=False):
+    """
+    Latency, throughput and CPU come from an untraced pass. With `trace_memory`, the same
+    workload (same seed, fresh cache) is replayed under tracemalloc in a second pass, since
+    tracing every allocation slows the Python glue down and would skew the latency figures.
+    """
+    if backend == "stub":
+        install_stub_backend(latency_ms, time_latency_ms)
+    elif getattr(sys.modules.get("vedastro"), "is_loadtest_stub", False):
+        del sys.modules["vedastro"]
+    # mri_scan binds the vedastro names at import, so re-import it for every run; otherwise a
+    # latency sweep in one process keeps measuring the first stub it saw
+    import mri_scan
+    importlib.reload(mri_scan)
+    run_mri_scan = mri_scan.run_mri_scan
+
+    scan = ScanCache(run_mri_scan) if use_cache else run_mri_scan
+    results, wall = run_sessions(scan, sessions, reruns, change_prob, think_ms, seed)
+
+    memory = None
+    if trace_memory:
+        traced_scan = ScanCache(run_mri_scan) if use_cache else run_mri_scan
+        tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        run_sessions(traced_scan, sessions, reruns, change_prob, think_ms, seed)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory = {
+            # tracemalloc can't split the heap by thread, so this is the peak growth averaged over sessions.
+            # Python heap only: allocations inside the .NET runtime behind vedastro aren't traced.
+            "Avg_KB_Per_Session": round((peak - baseline) / 1024 / sessions, 1),
+            "Peak_Traced_KB": round(peak / 1024, 1),
+            "Scope": "Python heap (tracemalloc), separate pass",
+        }
+
+    all_latencies = [l for r in results for l in r["Latencies_ms"]]
+    cpu = [r["CPU_s"] for r in results]
+    return {
+        "Metadata": {
+            "Backend": backend,
+            "Sessions": sessions,
+            "Reruns_Per_Session": reruns,
+            "Stub_Latency_ms": {"Calculate": latency_ms, "Time": time_latency_ms} if backend == "stub" else None,
+            "Cache_Enabled": use_cache,
+            "Memory_Traced": trace_memory,
+        },
+        "Latency_ms": {
+            "p50": round(percentile(all_latencies, 50), 2),
+            "p90": round(percentile(all_latencies, 90), 2),
+            "p95": round(percentile(all_latencies, 95), 2),
+            "p99": round(percentile(all_latencies, 99), 2),
+            "Max": round(max(all_latencies, default=0.0), 2),
+        },
+        "Throughput_Reruns_per_s": round(len(all_latencies) / wall, 2) if wall else 0.0,
+        "CPU_s_Per_Session": {"Mean": round(sum(cpu) / len(cpu), 4), "Max": round(max(cpu), 4)},
+        "Memory": memory,
+        "Cache": {"Hits": scan.hits, "Misses": scan.misses,
+                  "Hit_Rate": round(scan.hits / max(1, scan.hits + scan.misses), 3)} if use_cache else None,
+        "Errors": sum(r["Errors"] for r in results),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless load test for the Soul MRI dashboard")
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--reruns", type=int, default=5)
+    parser.add_argument("--backend", choices=["real", "stub"], default="real")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="stub latency per Calculate call")
+    parser.add_argument("--time-latency-ms", type=float, default=5.0, help="stub latency per Time() construction")
+    parser.add_argument("--cache", action="store_true", help="wrap run_mri_scan in an LRU like st.cache_data")
+    parser.add_argument("--change-prob", type=float, default=0.3, help="chance a rerun changes the sidebar inputs")
+    parser.add_argument("--think-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--trace-memory", action="store_true", help="replay the load under tracemalloc in a second pass")
+    parser.add_argument("--output", default=None, help="also write the summary to this JSON file")
+    args = parser.parse_args()
+
+    summary = run_load_test(args.sessions, args.reruns, args.backend, args.latency_ms, args.time_latency_ms,
+                            args.cache, args.change_prob, args.think_ms, args.seed, args.trace_memory)
+    print(json.dumps(summary, indent=4))
+    if args.output:
+        with open(args.output, "w") as outfile:
+            json.dump(summary, outfile, indent=4)
@@ -0,0 +1,72 @@
+import sys
+import types
+import datetime
+
+# --- 1. CRITICAL PYTHON 3.13 POLYFILL ---
+if "pkg_resources" not in sys.modules:
+    mock_pkg = types.ModuleType("pkg_resources")
+    mock_pkg.declare_namespace = lambda name: None
+    mock_pkg.get_distribution = lambda name: types.SimpleNamespace(version="0.0.0")
+    sys.modules["pkg_resources"] = mock_pkg
+
+from vedastro import *
+
+# The dashboard's computation path, kept free of Streamlit calls so it can be
+# driven headlessly (see loadtest.py) as well as rendered by app.py.
+
+MRI_PLANETS = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
+
+
+# --- 2. DYNAMIC DISCOVERY ENGINE ---
+def get_vedastro_metric(method_base, *args):
+    """
+    Scans the library for method variants (e.g., Tithi, GetTithi, GetTithiName).
+    This prevents 'AttributeError' when the library updates.
+    """
+    search_space = [Calculate, PanchangaCalculator] if 'PanchangaCalculator' in globals() else [Calculate]
+    variants = [method_base, f"Get{method_base}", f"{method_base}Name", f"Get{method_base}Name"]
+    
+    for scope in search_space:
+        for var in variants:
+            if hasattr(scope, var):
+                try:
+                    func = getattr(scope, var)
+                    result = func(*args)
+                    # If the result is a complex object, try to extract its name/value
+                    if hasattr(result, "Name"): return str(result.Name)
+                    if hasattr(result, "ToString"): return str(result.ToString())
+                    return str(result)
+                except:
+                    continue
+    return "N/A"
+
+
+def run_mri_scan(lat, lon, b_date, b_time, b_tz, now_dt=None):
+    """One full dashboard rerun: returns the three panchang metrics and the transit table rows"""
+    # Initialize Core Objects
+    loc = GeoLocation("Location", lon, lat)
+    # Correct Time String Format for VedAstro Parser
+    time_str = f"{b_time.strftime('%H:%M')} {b_date.strftime('%d/%m/%Y')} {b_tz}"
+    birth_time = Time(time_str, loc)
+
+    now_dt = now_dt or datetime.datetime.now()
+    now_str = f"{now_dt.strftime('%H:%M %d/%m/%Y')} +00:00"
+    now_time = Time(now_str, loc)
+
+    mri_results = []
+    for name in MRI_PLANETS:
+        p = getattr(PlanetName, name)
+        sign = get_vedastro_metric("PlanetSign", p, now_time)
+        mri_results.append({"Planet": name, "MRI Reading": sign})
+
+    return {
+        "Birth_Time": birth_time,
+        # Metric 1: Lunar Phase (The Emotional MRI)
+        "Tithi": get_vedastro_metric("Tithi", now_time),
+        # Metric 2: Mind Mansion (The Mental MRI)
+        "Nakshatra": get_vedastro_metric("MoonNakshatra", now_time),
+        # Metric 3: Yoga (The Vitality MRI)
+        "Yoga": get_vedastro_metric("Yoga", now_time),
+        # Metric 4: Planet Positions
+        "Transits": mri_results,
+    }
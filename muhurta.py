@@ -0,0 +1,195 @@
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime, date, timedelta
+import numpy as np
+
+# Sunrise/sunset and the daily windows derived from them (Rahu Kaal, Yamaganda, Gulika,
+# Abhijit Muhurta, day lord), computed for whole date ranges in one NumPy pass.
+# Results are cached per (rounded lat/lon, offset, date) with LRU eviction.
+
+DAY_LORDS = ["Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Sun"]  # indexed by date.weekday()
+
+# 1-indexed eighth of the daytime occupied by each period, indexed by date.weekday() (Mon = 0)
+RAHU_KAAL_PART = np.array([2, 7, 5, 6, 4, 3, 8])
+YAMAGANDA_PART = np.array([4, 3, 2, 1, 7, 6, 5])
+GULIKA_PART = np.array([6, 5, 4, 3, 2, 1, 7])
+
+J2000 = date(2000, 1, 1)
+SUN_ALTITUDE_AT_RISE = -0.833  # refraction + solar semi-diameter, in degrees
+
+
+def parse_offset(offset_str):
+    """'+05:30' -> timedelta(hours=5, minutes=30)"""
+    o = str(offset_str).strip()
+    sign = -1 if o.startswith("-") else 1
+    hours, minutes = o.lstrip("+-").split(":")
+    return sign * timedelta(hours=int(hours), minutes=int(minutes))
+
+
+def compute_sun_times(lat, lon, dates):
+    """
+    Sunrise and sunset for every date in `dates` (NOAA sunrise equation, vectorized).
+    Returns two float arrays of hours after 00:00 UTC on each date; NaN where the Sun
+    doesn't rise or set (polar day/night).
+    """
+    n = np.array([(d - J2000).days for d in dates], dtype=float)
+    j_star = n - lon / 360.0
+
+    m = np.radians((357.5291 + 0.98560028 * j_star) % 360)
+    c = 1.9148 * np.sin(m) + 0.0200 * np.sin(2 * m) + 0.0003 * np.sin(3 * m)
+    ecliptic_lon = np.radians((np.degrees(m) + c + 180 + 102.9372) % 360)
+    j_transit = j_star + 0.0053 * np.sin(m) - 0.0069 * np.sin(2 * ecliptic_lon)
+
+    sin_decl = np.sin(ecliptic_lon) * np.sin(np.radians(23.4397))
+    cos_decl = np.cos(np.arcsin(sin_decl))
+    phi = np.radians(lat)
+    cos_hour_angle = (np.sin(np.radians(SUN_ALTITUDE_AT_RISE)) - np.sin(phi) * sin_decl) / (np.cos(phi) * cos_decl)
+    with np.errstate(invalid="ignore"):
+        hour_angle = np.degrees(np.arccos(cos_hour_angle))
+
+    # j_transit counts days from J2000 noon UTC; shift so 0 is 00:00 UTC on each date
+    transit_hours = (j_transit - n + 0.5) * 24
+    sunrise = transit_hours - hour_angle / 360 * 24
+    sunset = transit_hours + hour_angle / 360 * 24
+    return sunrise, sunset
+
+
+def compute_daily_windows(lat, lon, dates, offset_str):
+    """One dict per date with sunrise/sunset and every derived window as local datetimes"""
+    offset_hours = parse_offset(offset_str).total_seconds() / 3600
+    sunrise, sunset = compute_sun_times(lat, lon, dates)
+    sunrise = sunrise + offset_hours
+    sunset = sunset + offset_hours
+    day_length = sunset - sunrise
+
+    weekdays = np.array([d.weekday() for d in dates])
+    eighth = day_length / 8
+    rahu_start = sunrise + (RAHU_KAAL_PART[weekdays] - 1) * eighth
+    yama_start = sunrise + (YAMAGANDA_PART[weekdays] - 1) * eighth
+    gulika_start = sunrise + (GULIKA_PART[weekdays] - 1) * eighth
+    # Abhijit is the 8th of the 15 daytime muhurtas, centred on local noon
+    abhijit_start = sunrise + day_length * 7 / 15
+    abhijit_end = sunrise + day_length * 8 / 15
+
+    def at(d, hours):
+        if np.isnan(hours):
+            return None
+        return datetime(d.year, d.month, d.day) + timedelta(seconds=round(float(hours) * 3600))
+
+    results = []
+    for i, d in enumerate(dates):
+        results.append({
+            "Date": d,
+            "Sunrise": at(d, sunrise[i]),
+            "Sunset": at(d, sunset[i]),
+            "Day_Lord": DAY_LORDS[weekdays[i]],
+            "Rahu_Kaal": (at(d, rahu_start[i]), at(d, rahu_start[i] + eighth[i])),
+            "Yamaganda": (at(d, yama_start[i]), at(d, yama_start[i] + eighth[i])),
+            "Gulika": (at(d, gulika_start[i]), at(d, gulika_start[i] + eighth[i])),
+            "Abhijit_Muhurta": (at(d, abhijit_start[i]), at(d, abhijit_end[i])),
+        })
+    return results
+
+
+class MuhurtaCache:
+    """
+    LRU cache of daily windows keyed by (lat, lon rounded to `precision`, offset, date).
+    get_range() computes all missing dates of a request in a single batch. Thread-safe, since
+    Streamlit serves every session from its own thread.
+    """
+
+    def __init__(self, max_entries=20000, precision=2):
+        self.max_entries = max_entries
+        self.precision = precision
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, lat, lon, offset_str, d):
+        return (round(float(lat), self.precision), round(float(lon), self.precision), str(offset_str).strip(), d)
+
+    def get_range(self, lat, lon, start_date, end_date, offset_str="+05:30"):
+        """Daily windows for every date from start_date to end_date inclusive"""
+        dates = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        keys = [self._key(lat, lon, offset_str, d) for d in dates]
+
+        with self.lock:
+            found = {k: self.entries[k] for k in keys if k in self.entries}
+            for k in found:
+                self.entries.move_to_end(k)
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+
+        missing = [d for d, k in zip(dates, keys) if k not in found]
+        if missing:
+            # Compute at the rounded coordinates so cached values don't depend on who asked first
+            r_lat, r_lon = keys[0][0], keys[0][1]
+            computed = compute_daily_windows(r_lat, r_lon, missing, offset_str)
+            with self.lock:
+                for day in computed:
+                    k = self._key(lat, lon, offset_str, day["Date"])
+                    self.entries[k] = day
+                    found[k] = day
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+
+        return [found[k] for k in keys]
+
+    def get_day(self, lat, lon, day, offset_str="+05:30"):
+        return self.get_range(lat, lon, day, day, offset_str)[0]
+
+
+_default_cache = MuhurtaCache()
+
+
+def get_muhurta_range(lat, lon, start_date, end_date, offset_str="+05:30", cache=None):
+    return (cache or _default_cache).get_range(lat, lon, start_date, end_date, offset_str)
+
+
+def get_muhurta_day(lat, lon, day, offset_str="+05:30", cache=None):
+    return (cache or _default_cache).get_day(lat, lon, day, offset_str)
+
+
+def sunrise_time_str(day_info, offset_str):
+    """
+    Sunrise in the "HH:mm DD/MM/YYYY +HH:MM" format VedAstro's Time() expects (for a sunrise Tithi).
+    None when the Sun doesn't rise that day (polar day/night).
+    """
+    if day_info["Sunrise"] is None:
+        return None
+    return f"{day_info['Sunrise'].strftime('%H:%M %d/%m/%Y')} {offset_str}"
+
+
+def format_day(day_info):
+    """JSON-friendly copy of a cached day"""
+    def fmt(dt):
+        return dt.strftime("%Y-%m-%d %H:%M") if dt else None
+
+    out = {"Date": day_info["Date"].strftime("%Y-%m-%d"), "Day_Lord": day_info["Day_Lord"],
+           "Sunrise": fmt(day_info["Sunrise"]), "Sunset": fmt(day_info["Sunset"])}
+    for name in ["Rahu_Kaal", "Yamaganda", "Gulika", "Abhijit_Muhurta"]:
+        start, end = day_info[name]
+        out[name] = {"Start": fmt(start), "End": fmt(end)}
+    return out
+
+
+if __name__ == "__main__":
+    with open("config.json", "r") as f:
+        config = json.load(f)
+
+    loc = config["current_details"]["location"]
+    offset = config["current_details"]["timezone_offset"]
+    start = datetime.strptime(config["current_details"]["query_date"], "%d/%m/%Y").date()
+
+    days = get_muhurta_range(loc["latitude"], loc["longitude"], start, start + timedelta(days=29), offset)
+    payload = {
+        "Metadata": {"City": loc["city"], "Timezone": offset, "Days": len(days)},
+        "MU-001_Daily_Muhurta": [format_day(d) for d in days]
+    }
+
+    output_file = "5.muhurta_payload.json"
+    with open(output_file, "w") as outfile:
+        json.dump(payload, outfile, indent=4)
+    print(f"File Saved: {output_file}")
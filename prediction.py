@@ -0,0 +1,309 @@
+import os
+import json
+from datetime import datetime, timedelta
+from vedastro import *
+
+# Python port of the Move prototype's PredictionManager.GetPredictions(birthTime, now, endPoint).
+# Every rule is a transit-vs-natal check evaluated on a shared time grid: each planet's
+# position is pulled once per grid step and all rules are checked against that snapshot.
+
+zodiac = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
+
+ALL_PLANETS = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu"]
+
+# "From" is the natal reference point: "Lagna", "Moon" or any natal planet name.
+# "Houses" are counted inclusively from that reference (1 = same sign).
+PREDICTION_RULES = [
+    {"Name": "Sade Sati (Rising)", "Nature": "Bad", "Planet": "Saturn", "From": "Moon", "Houses": [12]},
+    {"Name": "Sade Sati (Peak)", "Nature": "Bad", "Planet": "Saturn", "From": "Moon", "Houses": [1]},
+    {"Name": "Sade Sati (Setting)", "Nature": "Bad", "Planet": "Saturn", "From": "Moon", "Houses": [2]},
+    {"Name": "Ashtama Shani", "Nature": "Bad", "Planet": "Saturn", "From": "Moon", "Houses": [8]},
+    {"Name": "Kantaka Shani", "Nature": "Bad", "Planet": "Saturn", "From": "Moon", "Houses": [4, 7, 10]},
+    {"Name": "Saturn Gochara Favourable", "Nature": "Good", "Planet": "Saturn", "From": "Moon", "Houses": [3, 6, 11]},
+    {"Name": "Jupiter Gochara Favourable", "Nature": "Good", "Planet": "Jupiter", "From": "Moon", "Houses": [2, 5, 7, 9, 11]},
+    {"Name": "Jupiter Gochara Unfavourable", "Nature": "Bad", "Planet": "Jupiter", "From": "Moon", "Houses": [1, 3, 4, 6, 8, 10, 12]},
+    {"Name": "Rahu Gochara Favourable", "Nature": "Good", "Planet": "Rahu", "From": "Moon", "Houses": [3, 6, 11]},
+    {"Name": "Mars Gochara Favourable", "Nature": "Good", "Planet": "Mars", "From": "Moon", "Houses": [3, 6, 11]},
+    {"Name": "Sun Gochara Favourable", "Nature": "Good", "Planet": "Sun", "From": "Moon", "Houses": [3, 6, 10, 11]},
+    {"Name": "Venus Gochara Favourable", "Nature": "Good", "Planet": "Venus", "From": "Moon", "Houses": [1, 2, 3, 4, 5, 8, 9, 11, 12]},
+    {"Name": "Mercury Gochara Favourable", "Nature": "Good", "Planet": "Mercury", "From": "Moon", "Houses": [2, 4, 6, 8, 10, 11]},
+    {"Name": "Chandrashtama", "Nature": "Bad", "Planet": "Moon", "From": "Moon", "Houses": [8]},
+    {"Name": "Moon Gochara Favourable", "Nature": "Good", "Planet": "Moon", "From": "Moon", "Houses": [1, 3, 6, 7, 10, 11]},
+    {"Name": "Jupiter Transiting Lagna", "Nature": "Good", "Planet": "Jupiter", "From": "Lagna", "Houses": [1]},
+    {"Name": "Saturn Transiting Lagna", "Nature": "Bad", "Planet": "Saturn", "From": "Lagna", "Houses": [1]},
+    {"Name": "Saturn Return", "Nature": "Neutral", "Planet": "Saturn", "From": "Saturn", "Houses": [1]},
+    {"Name": "Jupiter Return", "Nature": "Good", "Planet": "Jupiter", "From": "Jupiter", "Houses": [1]},
+]
+
+
+def load_config(filepath="config.json"):
+    with open(filepath, 'r') as file:
+        return json.load(file)
+
+
+def setup_vedastro_time(date_str, time_str, offset_str, lat, lon, city):
+    # VedAstro strictly requires format: "HH:mm DD/MM/YYYY +HH:MM"
+    combined_time_str = f"{time_str} {date_str} {offset_str}"
+    geolocation = GeoLocation(city, lat, lon)
+    return Time(combined_time_str, geolocation)
+
+
+def sign_name(sign):
+    """Name of a sign result: payload dict {'Name': ...}, library object with .Name, or plain string"""
+    if isinstance(sign, dict):
+        sign = sign.get("Name", "Unknown")
+    elif hasattr(sign, "Name"):
+        sign = sign.Name
+    return str(sign).split('.')[-1]
+
+
+def get_planet_sign(planet_name, time):
+    """
+    Sign name of `planet_name` ('Sun', 'Moon', ...) at `time`. Uses the sign-only
+    Calculate.PlanetRasiD1Sign; AllPlanetData builds the whole payload (shadbala, every
+    varga...) and is only the fallback for builds without it.
+    """
+    planet = getattr(PlanetName, planet_name)
+    if hasattr(Calculate, "PlanetRasiD1Sign"):
+        return sign_name(Calculate.PlanetRasiD1Sign(planet, time))
+    p_data = Calculate.AllPlanetData(planet, time)
+    # Verified 2026 path: PlanetRasiD1Sign -> Name
+    return sign_name(p_data.get("PlanetRasiD1Sign", {}))
+
+
+def get_natal_reference(birth_time, planets):
+    """Sign index of the Lagna and of every natal planet a rule can count from"""
+    natal = {"Lagna": zodiac.index(str(Calculate.LagnaSignName(birth_time)))}
+    for p in planets:
+        natal[p] = zodiac.index(get_planet_sign(p, birth_time))
+    return natal
+
+
+def parse_offset(offset_str):
+    """'+05:30' -> timedelta(hours=5, minutes=30)"""
+    o = str(offset_str).strip()
+    sign = -1 if o.startswith("-") else 1
+    hours, minutes = o.lstrip("+-").split(":")
+    return sign * timedelta(hours=int(hours), minutes=int(minutes))
+
+
+def build_time_grid(start_dt, end_dt, step_hours):
+    """
+    Grid points are snapped to whole multiples of `step_hours` since the epoch,
+    so two overlapping horizons share the same timestamps (and the same cache keys).
+    Pass UTC datetimes so users in different timezones land on the same grid.
+    """
+    step = timedelta(hours=step_hours)
+    epoch = datetime(1970, 1, 1)
+    first = epoch + ((start_dt - epoch) // step) * step
+    grid = []
+    current = first
+    while current <= end_dt:
+        grid.append(current)
+        current += step
+    return grid
+
+
+class SkyStateCache:
+    """
+    Per-grid-step transit snapshot: {"YYYY-MM-DD HH:MMZ": {"Saturn": 11, ...}} (UTC keys, sign indices).
+    Transit positions don't depend on the native, so one cache serves every user on the same step.
+    Optionally persisted to a JSON file so later horizons reuse earlier runs.
+    """
+
+    def __init__(self, filepath=None):
+        self.filepath = filepath
+        self.states = {}
+        self.hits = 0
+        self.misses = 0
+        if filepath and os.path.exists(filepath):
+            with open(filepath, 'r') as f:
+                self.states = json.load(f)
+
+    def get(self, key, planets):
+        state = self.states.get(key)
+        if state is not None and all(p in state for p in planets):
+            self.hits += 1
+            return state
+        self.misses += 1
+        return None
+
+    def put(self, key, state):
+        self.states.setdefault(key, {}).update(state)
+
+    def save(self):
+        if self.filepath:
+            with open(self.filepath, 'w') as f:
+                json.dump(self.states, f)
+
+
+def get_sky_state(grid_utc, geolocation, planets, cache=None):
+    """Sign index of every planet in `planets` at UTC instant `grid_utc`, one library call per planet"""
+    key = grid_utc.strftime("%Y-%m-%d %H:%MZ")
+    if cache is not None:
+        state = cache.get(key, planets)
+        if state is not None:
+            return state
+
+    target_time = Time(grid_utc.strftime("%H:%M %d/%m/%Y +00:00"), geolocation)
+    state = {p: zodiac.index(get_planet_sign(p, target_time)) for p in planets}
+
+    if cache is not None:
+        cache.put(key, state)
+    return state
+
+
+def find_sign_change(planet, before_utc, after_utc, before_sign, geolocation, resolution_minutes=1):
+    """
+    Bisects between two UTC instants where `planet` is in different signs. Returns the first
+    instant (to `resolution_minutes`) at which it has left sign index `before_sign`.
+    Assumes a single sign change in between, which holds for any grid step under ~2 days.
+    """
+    lo, hi = before_utc, after_utc
+    while (hi - lo) > timedelta(minutes=resolution_minutes):
+        mid = lo + timedelta(minutes=int((hi - lo).total_seconds() // 60) // 2)
+        if mid <= lo:
+            break
+        mid_time = Time(mid.strftime("%H:%M %d/%m/%Y +00:00"), geolocation)
+        if zodiac.index(get_planet_sign(planet, mid_time)) == before_sign:
+            lo = mid
+        else:
+            hi = mid
+    return hi
+
+
+def find_ingresses(planet, start_dt, end_dt, geolocation, step_hours=24, cache=None, resolution_minutes=1):
+    """
+    (UTC datetime, sign name) for every sign change of `planet` between the UTC datetimes
+    start_dt and end_dt, refined to `resolution_minutes` (None = first grid point in the new sign).
+    """
+    ingresses = []
+    previous_utc, previous = None, None
+    for grid_utc in build_time_grid(start_dt, end_dt, step_hours):
+        sign = get_sky_state(grid_utc, geolocation, [planet], cache)[planet]
+        if previous is not None and sign != previous:
+            entry = grid_utc
+            if resolution_minutes:
+                entry = find_sign_change(planet, previous_utc, grid_utc, previous, geolocation, resolution_minutes)
+            ingresses.append((entry, zodiac[sign]))
+        previous_utc, previous = grid_utc, sign
+    return ingresses
+
+
+def rule_matches(rule, natal, sky_state):
+    house = (sky_state[rule["Planet"]] - natal[rule["From"]]) % 12 + 1
+    return house in rule["Houses"]
+
+
+def get_predictions(birth_time, start_dt, end_dt, offset, geolocation, rules=None, step_hours=6, cache=None,
+                    resolution_minutes=1):
+    """
+    Dated event windows between start_dt and end_dt (naive local datetimes in `offset`).
+    Returns a list of {"Name", "Nature", "Start", "End"} sorted by start.
+    A window still open at the horizon edge ends at end_dt. Rules are checked on the grid;
+    each edge is then bisected down to `resolution_minutes` (None keeps grid-step edges).
+    """
+    rules = PREDICTION_RULES if rules is None else rules
+    transit_planets = sorted({r["Planet"] for r in rules}, key=ALL_PLANETS.index)
+    natal_planets = sorted({r["From"] for r in rules if r["From"] != "Lagna"}, key=ALL_PLANETS.index)
+    natal = get_natal_reference(birth_time, natal_planets)
+
+    # The grid (and the cache keys) live in UTC; windows are reported back in local time
+    utc_offset = parse_offset(offset)
+    grid = build_time_grid(start_dt - utc_offset, end_dt - utc_offset, step_hours)
+    open_windows = {}
+    events = []
+
+    previous_utc, previous_state = None, None
+
+    for grid_utc in grid:
+        sky_state = get_sky_state(grid_utc, geolocation, transit_planets, cache)
+
+        # Every rule depends on one planet's sign, so a rule edge is that planet's sign change
+        change_utc = {}
+        if previous_state is not None and resolution_minutes:
+            for p in transit_planets:
+                if sky_state[p] != previous_state[p]:
+                    change_utc[p] = find_sign_change(p, previous_utc, grid_utc, previous_state[p],
+                                                     geolocation, resolution_minutes)
+
+        for i, rule in enumerate(rules):
+            window_dt = max(change_utc.get(rule["Planet"], grid_utc) + utc_offset, start_dt)
+            if rule_matches(rule, natal, sky_state):
+                if i not in open_windows:
+                    open_windows[i] = window_dt
+            elif i in open_windows:
+                events.append((rule, open_windows.pop(i), window_dt))
+
+        previous_utc, previous_state = grid_utc, sky_state
+
+    for i, opened in open_windows.items():
+        events.append((rules[i], opened, end_dt))
+
+    events.sort(key=lambda e: (e[1], e[0]["Name"]))
+    return [
+        {
+            "Name": rule["Name"],
+            "Nature": rule["Nature"],
+            "Start": start.strftime("%Y-%m-%d %H:%M"),
+            "End": end.strftime("%Y-%m-%d %H:%M"),
+        }
+        for rule, start, end in events
+    ]
+
+
+def run_prediction_audit(config, days_to_forecast=7, step_hours=6, cache_file="prediction_cache.json",
+                         resolution_minutes=1):
+    birth_time = setup_vedastro_time(
+        config["birth_details"]["date_of_birth"], config["birth_details"]["time_of_birth"],
+        config["birth_details"]["timezone_offset"], config["birth_details"]["location"]["latitude"],
+        config["birth_details"]["location"]["longitude"], config["birth_details"]["location"]["city"]
+    )
+
+    loc = config["current_details"]["location"]
+    geolocation = GeoLocation(loc["city"], loc["latitude"], loc["longitude"])
+    offset = config["current_details"]["timezone_offset"]
+
+    start_dt = datetime.strptime(
+        f"{config['current_details']['query_date']} {config['current_details']['query_time']}", "%d/%m/%Y %H:%M")
+    end_dt = start_dt + timedelta(days=days_to_forecast)
+
+    cache = SkyStateCache(cache_file)
+    skipped_calculations = []
+    events = []
+    try:
+        events = get_predictions(birth_time, start_dt, end_dt, offset, geolocation, step_hours=step_hours, cache=cache,
+                                 resolution_minutes=resolution_minutes)
+        cache.save()
+    except Exception as e:
+        skipped_calculations.append({"UID": "PR-001", "Reason": f"{type(e).__name__}: {str(e)}"})
+
+    return {
+        "Metadata": {
+            "UID_Reference": ["PR-001"],
+            "Window_Start": start_dt.strftime("%Y-%m-%d %H:%M"),
+            "Window_End": end_dt.strftime("%Y-%m-%d %H:%M"),
+            "Grid_Step_Hours": step_hours,
+            # Window edges are bisected to this; without refinement they are only as fine as the grid step
+            "Edge_Resolution_Minutes": resolution_minutes or step_hours * 60,
+            "Cache": {"Hits": cache.hits, "Misses": cache.misses}
+        },
+        "Audit_Log": {
+            "Timestamp": str(datetime.now()),
+            "Skipped_Calculations": skipped_calculations
+        },
+        "PR-001_Event_Windows": events
+    }
+
+
+if __name__ == "__main__":
+    config_data = load_config("config.json")
+    final_payload = run_prediction_audit(config_data)
+
+    output_file = "4.prediction_payload.json"
+    with open(output_file, "w") as outfile:
+        json.dump(final_payload, outfile, indent=4)
+
+    print(f"--- Prediction Audit Complete ---")
+    print(f"Events Found: {len(final_payload['PR-001_Event_Windows'])}")
+    print(f"File Saved: {output_file}")
@@ -0,0 +1,347 @@
+import os
+import ast
+import sys
+import json
+import time
+import difflib
+import argparse
+import fnmatch
+from datetime import datetime
+
+# Golden-file regression harness. Every case in golden/cases.json pairs a config with a
+# reference report (the checked-in Report_User_*.json seeds it; --record adds generated
+# fixtures). Each registered backend rebuilds the report from the config and is diffed
+# field by field against the reference with per-field numeric tolerances, while dasha
+# boundaries are matched within a tolerance in minutes. Timings are reported per backend.
+#
+#   python regression.py                          # all cases, all backends
+#   python regression.py --backend vedastro --case seed_1980_chandigarh
+#   python regression.py --record new_case --config config.json --scan-step-days 0.0416667   # hourly
+#
+# golden/dasha_boundaries.json holds synthetic minute-resolution TM-002 sequences that
+# exercise the boundary check without a backend (see test_regression.py).
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+CASES_FILE = os.path.join(GOLDEN_DIR, "cases.json")
+
+DASHA_SEQUENCE_PATH = "Dasha_Timeline.Dasha_Timeline.TM-002_Full_Sequence"
+
+# (path pattern, absolute tolerance) - first match wins; anything else numeric uses DEFAULT_TOLERANCE
+FIELD_TOLERANCES = [
+    ("*.Degree", 0.02),                # rounded to 2 places by the builders
+    ("*.TotalDegrees", 0.01),
+    ("*.DegreeMinuteSecond", 0.01),    # compared as decimal degrees
+    ("*.ST-003_Shadbala.*", 1.0),
+]
+DEFAULT_TOLERANCE = 1e-6
+# Used when a case sets no "Dasha_Tolerance_Minutes". TM-002 boundaries are only as fine as the
+# dasha scan step ("Dasha_Scan_Step_Days", 20 by default), so coarse fixtures need a wider window.
+DASHA_TOLERANCE_MINUTES = 24 * 60
+DASHA_SCAN_STEP_DAYS = 20
+
+# Wall-clock stamps and free text that legitimately change on every run
+IGNORED_PATHS = [
+    "*.Calculation_Date",
+    "*.Audit_Log.Timestamp",
+    "*.Audit_Log.Notes",
+    "Dasha_Timeline.Metadata.*",
+    "Report_Metadata.Report_Name",
+]
+
+
+def load_config(filepath="config.json"):
+    with open(filepath, 'r') as file:
+        return json.load(file)
+
+
+# --- BACKENDS ---
+# A backend is (config, scan_step_days) -> merged report (same shape as Report_User_*.json). Alternative
+# implementations (cached, local varga math, analytic dashas, NumPy ephemeris...) register here.
+
+def report_name_for(config):
+    b = config["birth_details"]
+    loc = b["location"]
+    return f"Report_User_{b['date_of_birth'].replace('/', '-')}_Lat{loc['latitude']}_Lon{loc['longitude']}.json"
+
+
+def query_datetime(config):
+    c = config["current_details"]
+    return datetime.strptime(f"{c['query_date']} {c['query_time']}", "%d/%m/%Y %H:%M")
+
+
+def vedastro_backend(config, scan_step_days=DASHA_SCAN_STEP_DAYS):
+    import static
+    import dasha
+    import transit
+
+    loc = config["birth_details"]["location"]
+    return {
+        "Report_Metadata": {
+            "Status": "Complete",
+            "Report_Name": report_name_for(config),
+            "Coordinates": {"Lat": loc["latitude"], "Lon": loc["longitude"]}
+        },
+        "Static_Calculations": static.generate_astrology_data(config),
+        "Dasha_Timeline": dasha.generate_dasha_audit_file(config, now_dt=query_datetime(config), output_file=None,
+                                                     scan_step_days=scan_step_days),
+        "Transit_Details": transit.run_transit_audit(config),
+    }
+
+
+BACKENDS = {
+    "vedastro": vedastro_backend,
+}
+
+
+# --- DIFF ---
+
+def matches_any(path, patterns):
+    return any(fnmatch.fnmatchcase(path, p) for p in patterns)
+
+
+def tolerance_for(path):
+    for pattern, tol in FIELD_TOLERANCES:
+        if fnmatch.fnmatchcase(path, pattern):
+            return tol
+    return DEFAULT_TOLERANCE
+
+
+def as_number(value, path):
+    """Numbers, numeric strings ('378.03') and DMS strings ("1° 29' 51") -> float, else None"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        if path.endswith("DegreeMinuteSecond"):
+            try:
+                d, rest = value.split("°")
+                m, s = rest.split("'")
+                return int(d) + int(m) / 60 + float(s) / 3600
+            except ValueError:
+                return None
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def as_structure(value):
+    """The builders stringify library dicts ("{'Name': 'Mars'}"); parse them back for a structural diff"""
+    if isinstance(value, str) and value[:1] in "{[":
+        try:
+            parsed = ast.literal_eval(value)
+            if isinstance(parsed, (dict, list)):
+                return parsed
+        except (ValueError, SyntaxError):
+            pass
+    return value
+
+
+def diff_values(expected, actual, path, ignore, diffs, dasha_tolerance=None):
+    if matches_any(path, ignore):
+        return
+    if path == DASHA_SEQUENCE_PATH:
+        diffs.extend(diff_dasha_sequences(expected, actual, dasha_tolerance))
+        return
+
+    expected, actual = as_structure(expected), as_structure(actual)
+
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        for key in expected:
+            child = f"{path}.{key}" if path else str(key)
+            if key not in actual:
+                if not matches_any(child, ignore):
+                    diffs.append({"Path": child, "Reason": "Missing", "Expected": expected[key], "Actual": None})
+            else:
+                diff_values(expected[key], actual[key], child, ignore, diffs, dasha_tolerance)
+        for key in actual:
+            child = f"{path}.{key}" if path else str(key)
+            if key not in expected and not matches_any(child, ignore):
+                diffs.append({"Path": child, "Reason": "Extra", "Expected": None, "Actual": actual[key]})
+        return
+
+    if isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            diffs.append({"Path": path, "Reason": "Length", "Expected": len(expected), "Actual": len(actual)})
+        for i, (e, a) in enumerate(zip(expected, actual)):
+            diff_values(e, a, f"{path}[{i}]", ignore, diffs, dasha_tolerance)
+        return
+
+    e_num, a_num = as_number(expected, path), as_number(actual, path)
+    if e_num is not None and a_num is not None:
+        tol = tolerance_for(path)
+        if abs(e_num - a_num) > tol:
+            diffs.append({"Path": path, "Reason": f"Numeric (tol {tol})", "Expected": expected, "Actual": actual})
+        return
+
+    if expected != actual:
+        diffs.append({"Path": path, "Reason": "Value", "Expected": expected, "Actual": actual})
+
+
+def parse_dasha_date(value):
+    for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, fmt)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def diff_dasha_sequences(expected, actual, tolerance_minutes=None):
+    """
+    Aligns the two TM-002 sequences by (Level, Planet, Parent) and checks every boundary
+    within `tolerance_minutes`. Only the horizon both sequences cover is compared, so a
+    report generated on a later date doesn't fail just for running further ahead.
+    """
+    tolerance_minutes = DASHA_TOLERANCE_MINUTES if tolerance_minutes is None else tolerance_minutes
+    diffs = []
+
+    def horizon(seq):
+        ends = [parse_dasha_date(d.get("End")) for d in seq]
+        return max([e for e in ends if e], default=None)
+
+    h_exp, h_act = horizon(expected), horizon(actual)
+    common = min(h for h in (h_exp, h_act) if h) if (h_exp or h_act) else None
+
+    def within(seq):
+        return [d for d in seq if common is None or (parse_dasha_date(d.get("Start")) or common) < common]
+
+    exp_seq, act_seq = within(expected), within(actual)
+    key = lambda d: (d.get("Level"), d.get("Planet"), d.get("Parent"))
+    matcher = difflib.SequenceMatcher(a=[key(d) for d in exp_seq], b=[key(d) for d in act_seq], autojunk=False)
+
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            for e, a in zip(exp_seq[i1:i2], act_seq[j1:j2]):
+                for field in ("Start", "End"):
+                    e_dt, a_dt = parse_dasha_date(e.get(field)), parse_dasha_date(a.get(field))
+                    if e_dt is None or a_dt is None:
+                        continue
+                    # An End clipped at either report's horizon isn't a real boundary
+                    if field == "End" and common is not None and (e_dt >= common or a_dt >= common):
+                        continue
+                    delta = abs((e_dt - a_dt).total_seconds()) / 60
+                    if delta > tolerance_minutes:
+                        diffs.append({
+                            "Path": f"{DASHA_SEQUENCE_PATH}[{key(e)}].{field}",
+                            "Reason": f"Boundary off by {delta:.0f} min (tol {tolerance_minutes})",
+                            "Expected": e.get(field), "Actual": a.get(field)
+                        })
+        else:
+            diffs.append({
+                "Path": f"{DASHA_SEQUENCE_PATH}[{i1}:{i2}]",
+                "Reason": f"Sequence {tag}",
+                "Expected": [key(d) for d in exp_seq[i1:i2]],
+                "Actual": [key(d) for d in act_seq[j1:j2]]
+            })
+    return diffs
+
+
+def diff_reports(expected, actual, ignore=None, dasha_tolerance_minutes=None):
+    """Field-by-field differences between two merged reports (empty list = match)"""
+    diffs = []
+    diff_values(expected, actual, "", IGNORED_PATHS + list(ignore or []), diffs, dasha_tolerance_minutes)
+    return diffs
+
+
+# --- CASES ---
+
+def load_cases():
+    with open(CASES_FILE, 'r') as f:
+        return json.load(f)
+
+
+def load_reference(case):
+    path = os.path.join(GOLDEN_DIR, case["Report"])
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def case_scan_step(case):
+    return case.get("Dasha_Scan_Step_Days", DASHA_SCAN_STEP_DAYS)
+
+
+def case_dasha_tolerance(case):
+    return case.get("Dasha_Tolerance_Minutes", DASHA_TOLERANCE_MINUTES)
+
+
+def record_case(name, config, backend="vedastro", scan_step_days=DASHA_SCAN_STEP_DAYS):
+    """
+    Generates a new fixture with `backend` and adds it to golden/cases.json. The dasha
+    tolerance recorded with it is one scan step, the resolution of its TM-002 boundaries.
+    """
+    report = BACKENDS[backend](config, scan_step_days)
+    report_file = f"{name}.json"
+    with open(os.path.join(GOLDEN_DIR, report_file), "w") as f:
+        json.dump(report, f, indent=4)
+
+    cases = [c for c in load_cases() if c["Name"] != name]
+    cases.append({"Name": name, "Config": config, "Report": report_file, "Ignore": [],
+                  "Dasha_Scan_Step_Days": scan_step_days, "Dasha_Tolerance_Minutes": round(scan_step_days * 24 * 60)})
+    with open(CASES_FILE, "w") as f:
+        json.dump(cases, f, indent=4)
+    return report
+
+
+def run_regression(backends=None, case_names=None):
+    results = []
+    for case in load_cases():
+        if case_names and case["Name"] not in case_names:
+            continue
+        expected = load_reference(case)
+        for backend in backends or list(BACKENDS):
+            start = time.perf_counter()
+            try:
+                actual = BACKENDS[backend](case["Config"], case_scan_step(case))
+                error = None
+            except Exception as e:
+                actual, error = None, f"{type(e).__name__}: {str(e)}"
+            elapsed = time.perf_counter() - start
+
+            diffs = diff_reports(expected, actual, case.get("Ignore"), case_dasha_tolerance(case)) if actual is not None else []
+            results.append({
+                "Case": case["Name"],
+                "Backend": backend,
+                "Seconds": round(elapsed, 3),
+                "Passed": error is None and not diffs,
+                "Error": error,
+                "Differences": diffs,
+            })
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Golden-file regression and accuracy harness")
+    parser.add_argument("--backend", action="append", choices=list(BACKENDS), help="repeatable; default: all")
+    parser.add_argument("--case", action="append", help="repeatable; default: all cases")
+    parser.add_argument("--record", metavar="NAME", help="generate a new fixture from --config instead of checking")
+    parser.add_argument("--config", default="config.json")
+    parser.add_argument("--scan-step-days", type=float, default=DASHA_SCAN_STEP_DAYS,
+                        help="dasha scan step for --record; fractional for sub-day steps (1/24 = hourly)")
+    parser.add_argument("--max-diffs", type=int, default=20, help="differences printed per case/backend")
+    args = parser.parse_args()
+
+    if args.record:
+        record_case(args.record, load_config(args.config), (args.backend or ["vedastro"])[0], args.scan_step_days)
+        print(f"Recorded golden case '{args.record}'")
+        sys.exit(0)
+
+    results = run_regression(args.backend, args.case)
+
+    print(f"{'Case':<30} {'Backend':<12} {'Seconds':>8} {'Diffs':>6}  Result")
+    for r in results:
+        status = "PASS" if r["Passed"] else ("ERROR" if r["Error"] else "FAIL")
+        print(f"{r['Case']:<30} {r['Backend']:<12} {r['Seconds']:>8.3f} {len(r['Differences']):>6}  {status}")
+    for r in results:
+        if r["Error"]:
+            print(f"\n[{r['Case']} / {r['Backend']}] {r['Error']}")
+        if r["Differences"]:
+            print(f"\n[{r['Case']} / {r['Backend']}]")
+            for d in r["Differences"][:args.max_diffs]:
+                print(f"  {d['Path']}: {d['Reason']} | expected {d['Expected']!r} | actual {d['Actual']!r}")
+            if len(r["Differences"]) > args.max_diffs:
+                print(f"  ... {len(r['Differences']) - args.max_diffs} more")
+
+    sys.exit(0 if all(r["Passed"] for r in results) else 1)
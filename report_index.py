@@ -0,0 +1,441 @@
+import os
+import re
+import ast
+import glob
+import json
+import sqlite3
+from datetime import datetime
+
+# Merged reports follow: Report_User_<DD-MM-YYYY>_Lat<lat>_Lon<lon>.json
+REPORT_NAME_PATTERN = re.compile(r"Report_User_(\d{2}-\d{2}-\d{4})_Lat(-?[\d.]+)_Lon(-?[\d.]+)\.json$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    report_name TEXT PRIMARY KEY,
+    path TEXT,
+    mtime REAL,
+    dob TEXT,
+    lat REAL,
+    lon REAL,
+    status TEXT,
+    lagna TEXT,
+    moon_sign TEXT,
+    atmakaraka TEXT,
+    current_mahadasha TEXT,
+    current_antardasha TEXT,
+    current_pratyantardasha TEXT,
+    indexed_at TEXT
+);
+CREATE TABLE IF NOT EXISTS placements (
+    report_name TEXT,
+    planet TEXT,
+    sign TEXT,
+    degree REAL,
+    house INTEGER,
+    nakshatra TEXT,
+    pada INTEGER
+);
+CREATE TABLE IF NOT EXISTS house_lords (
+    report_name TEXT,
+    house INTEGER,
+    lord TEXT
+);
+CREATE TABLE IF NOT EXISTS shadbala (
+    report_name TEXT,
+    planet TEXT,
+    pinda REAL
+);
+CREATE TABLE IF NOT EXISTS dasha_periods (
+    report_name TEXT,
+    level TEXT,
+    planet TEXT,
+    parent TEXT,
+    start TEXT,
+    end TEXT
+);
+CREATE TABLE IF NOT EXISTS transits (
+    report_name TEXT,
+    planet TEXT,
+    sign TEXT,
+    house INTEGER
+);
+CREATE TABLE IF NOT EXISTS sade_sati (
+    report_name TEXT PRIMARY KEY,
+    is_active INTEGER,
+    phase TEXT
+);
+CREATE TABLE IF NOT EXISTS saturn_ingresses (
+    entry TEXT PRIMARY KEY,
+    sign TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_placements_planet_house ON placements (planet, house);
+CREATE INDEX IF NOT EXISTS idx_placements_planet_sign ON placements (planet, sign);
+CREATE INDEX IF NOT EXISTS idx_placements_report ON placements (report_name);
+CREATE INDEX IF NOT EXISTS idx_house_lords_house_lord ON house_lords (house, lord);
+CREATE INDEX IF NOT EXISTS idx_house_lords_report ON house_lords (report_name);
+CREATE INDEX IF NOT EXISTS idx_shadbala_planet_pinda ON shadbala (planet, pinda);
+CREATE INDEX IF NOT EXISTS idx_shadbala_report ON shadbala (report_name);
+CREATE INDEX IF NOT EXISTS idx_dasha_level_planet_start ON dasha_periods (level, planet, start, end);
+CREATE INDEX IF NOT EXISTS idx_dasha_level_start ON dasha_periods (level, start, end);
+CREATE INDEX IF NOT EXISTS idx_dasha_report ON dasha_periods (report_name);
+CREATE INDEX IF NOT EXISTS idx_transits_planet_house ON transits (planet, house);
+CREATE INDEX IF NOT EXISTS idx_transits_report ON transits (report_name);
+CREATE INDEX IF NOT EXISTS idx_reports_mahadasha ON reports (current_mahadasha);
+CREATE INDEX IF NOT EXISTS idx_reports_moon_sign ON reports (moon_sign);
+CREATE INDEX IF NOT EXISTS idx_sade_sati_active ON sade_sati (is_active, phase);
+"""
+
+CHILD_TABLES = ["placements", "house_lords", "shadbala", "dasha_periods", "transits", "sade_sati"]
+
+
+def clean_name(enum_str):
+    """Converts 'PlanetName.Sun' to 'Sun'"""
+    return str(enum_str).split('.')[-1]
+
+
+def parse_lord(raw):
+    """House lords are stored as "{'Name': 'Mars'}" strings by the builders"""
+    if isinstance(raw, dict):
+        return clean_name(raw.get("Name", "Unknown"))
+    try:
+        value = ast.literal_eval(str(raw))
+        if isinstance(value, dict):
+            return clean_name(value.get("Name", "Unknown"))
+    except (ValueError, SyntaxError):
+        pass
+    return clean_name(raw)
+
+
+def to_float(value, default=None):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def to_int(value, default=None):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def open_index(db_path="report_index.db"):
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def parse_report_name(report_name):
+    """Extracts (dob, lat, lon) from the report file name, or Nones if it doesn't match"""
+    match = REPORT_NAME_PATTERN.search(os.path.basename(report_name))
+    if not match:
+        return None, None, None
+    dob = datetime.strptime(match.group(1), "%d-%m-%Y").strftime("%Y-%m-%d")
+    return dob, float(match.group(2)), float(match.group(3))
+
+
+def dasha_period_rows(sequence):
+    """
+    (level, planet, parent, start, end) for every TM-002 entry. dasha.py fills each End
+    from the next entry's Start whatever its level, so ends are recomputed here: a period
+    runs until the next period of the same level starts, and an Antardasha also stops when
+    its parent Mahadasha does. The last period of each level runs to the sequence horizon
+    (the stored End of the final entry, the only End dasha.py sets to the horizon).
+    """
+    entries = [
+        (d.get("Level"), clean_name(d.get("Planet")), clean_name(d["Parent"]) if d.get("Parent") else None,
+         d.get("Start"), d.get("End"))
+        for d in sequence
+    ]
+
+    horizon = entries[-1][4] if entries else None
+    ends = [end for _, _, _, _, end in entries]
+    next_start = {}
+    for i in range(len(entries) - 1, -1, -1):
+        level, _, _, start, _ = entries[i]
+        ends[i] = next_start.get(level, horizon)
+        next_start[level] = start
+
+    # Cap each Antardasha at the end of the Mahadasha running when it started
+    md_spans = [(start, ends[i]) for i, (level, _, _, start, _) in enumerate(entries) if level == "Mahadasha"]
+    for i, (level, _, parent, start, _) in enumerate(entries):
+        if level != "Antardasha" or not start:
+            continue
+        for md_start, md_end in md_spans:
+            if md_start and md_end and md_start <= start < md_end:
+                ends[i] = min(ends[i], md_end) if ends[i] else md_end
+                break
+
+    return [entry[:4] + (end,) for entry, end in zip(entries, ends)]
+
+
+def extract_rows(report):
+    """Flattens a merged report dict into row tuples for every table (minus report_name)"""
+    static = report.get("Static_Calculations", {})
+    foundation = static.get("Static_Foundation", {})
+    timeline = report.get("Dasha_Timeline", {}).get("Dasha_Timeline", {})
+    transit_results = report.get("Transit_Details", {}).get("Transit_Results", {})
+
+    placements = []
+    for key, p in foundation.items():
+        if not key.startswith("ST-001_") or not isinstance(p, dict):
+            continue
+        placements.append((
+            key[len("ST-001_"):],
+            str(p.get("Sign", "Unknown")),
+            to_float(p.get("Degree")),
+            to_int(p.get("House")),
+            p.get("Nakshatra"),
+            to_int(p.get("Pada")),
+        ))
+
+    house_lords = []
+    for key, raw in foundation.get("ST-002_House_Lords", {}).items():
+        house_lords.append((to_int(key.lstrip("H")), parse_lord(raw)))
+
+    shadbala = []
+    for key, raw in foundation.get("ST-003_Shadbala", {}).items():
+        shadbala.append((clean_name(key), to_float(raw)))
+
+    dasha_periods = dasha_period_rows(timeline.get("TM-002_Full_Sequence", []))
+
+    transits = []
+    houses = transit_results.get("TR-002_Relative_Houses", {})
+    for planet, sign in transit_results.get("TR-001_Transit_Signs", {}).items():
+        transits.append((planet, str(sign), to_int(houses.get(f"{planet}_House"))))
+
+    sade_sati = []
+    ss = transit_results.get("TR-003_Sade_Sati")
+    if isinstance(ss, dict):
+        sade_sati.append((int(bool(ss.get("Is_Active", False))), ss.get("Phase", "None")))
+
+    active = timeline.get("TM-001_Active_Period", {})
+    summary = {
+        "status": report.get("Report_Metadata", {}).get("Status"),
+        "lagna": transit_results.get("Metadata", {}).get("Lagna"),
+        "moon_sign": transit_results.get("Metadata", {}).get("Moon"),
+        "atmakaraka": clean_name(timeline["TM-003_Atmakaraka"]) if timeline.get("TM-003_Atmakaraka") else None,
+        "current_mahadasha": active.get("Mahadasha"),
+        "current_antardasha": active.get("Antardasha"),
+        "current_pratyantardasha": active.get("Pratyantardasha"),
+    }
+
+    return summary, {
+        "placements": placements,
+        "house_lords": house_lords,
+        "shadbala": shadbala,
+        "dasha_periods": dasha_periods,
+        "transits": transits,
+        "sade_sati": sade_sati,
+    }
+
+
+INSERTS = {
+    "placements": "INSERT INTO placements VALUES (?, ?, ?, ?, ?, ?, ?)",
+    "house_lords": "INSERT INTO house_lords VALUES (?, ?, ?)",
+    "shadbala": "INSERT INTO shadbala VALUES (?, ?, ?)",
+    "dasha_periods": "INSERT INTO dasha_periods VALUES (?, ?, ?, ?, ?, ?)",
+    "transits": "INSERT INTO transits VALUES (?, ?, ?, ?)",
+    "sade_sati": "INSERT INTO sade_sati VALUES (?, ?, ?)",
+}
+
+
+def index_report(conn, path, report=None):
+    """
+    Ingests one merged report. Pass `report` when the dict is already in memory
+    (e.g. right after it was written) to skip re-reading the JSON file.
+    Re-indexing the same report replaces its previous rows.
+    """
+    report_name = os.path.basename(path)
+    if report is None:
+        with open(path, 'r') as f:
+            report = json.load(f)
+
+    mtime = os.path.getmtime(path) if os.path.exists(path) else None
+    dob, lat, lon = parse_report_name(report_name)
+    if lat is None:
+        coords = report.get("Report_Metadata", {}).get("Coordinates", {})
+        lat, lon = to_float(coords.get("Lat")), to_float(coords.get("Lon"))
+
+    summary, rows = extract_rows(report)
+
+    with conn:
+        for table in CHILD_TABLES:
+            conn.execute(f"DELETE FROM {table} WHERE report_name = ?", (report_name,))
+        conn.execute(
+            "INSERT OR REPLACE INTO reports VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (report_name, os.path.abspath(path), mtime, dob, lat, lon,
+             summary["status"], summary["lagna"], summary["moon_sign"], summary["atmakaraka"],
+             summary["current_mahadasha"], summary["current_antardasha"], summary["current_pratyantardasha"],
+             datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        )
+        for table, table_rows in rows.items():
+            conn.executemany(INSERTS[table], [(report_name,) + r for r in table_rows])
+    return report_name
+
+
+def index_directory(conn, directory=".", pattern="Report_User_*.json", force=False):
+    """
+    Indexes every report in `directory`. Files whose mtime hasn't changed since
+    the last run are skipped unless `force` is set.
+    Returns (indexed, skipped, failed) lists of report names.
+    """
+    known = {row["report_name"]: row["mtime"] for row in conn.execute("SELECT report_name, mtime FROM reports")}
+    indexed, skipped, failed = [], [], []
+
+    for path in sorted(glob.glob(os.path.join(directory, pattern))):
+        name = os.path.basename(path)
+        if not force and known.get(name) == os.path.getmtime(path):
+            skipped.append(name)
+            continue
+        try:
+            index_report(conn, path)
+            indexed.append(name)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            failed.append({"Report": name, "Reason": f"{type(e).__name__}: {str(e)}"})
+    return indexed, skipped, failed
+
+
+def remove_report(conn, report_name):
+    with conn:
+        for table in CHILD_TABLES + ["reports"]:
+            conn.execute(f"DELETE FROM {table} WHERE report_name = ?", (report_name,))
+
+
+# --- QUERY API ---
+# Every helper returns a list of report names so filters can be intersected.
+
+def _names(cursor):
+    return [row[0] for row in cursor]
+
+
+def reports_with_planet_in_house(conn, planet, house):
+    return _names(conn.execute(
+        "SELECT report_name FROM placements WHERE planet = ? AND house = ? ORDER BY report_name",
+        (clean_name(planet), int(house))))
+
+
+def reports_with_planet_in_sign(conn, planet, sign):
+    return _names(conn.execute(
+        "SELECT report_name FROM placements WHERE planet = ? AND sign = ? ORDER BY report_name",
+        (clean_name(planet), sign)))
+
+
+def reports_with_house_lord(conn, house, lord):
+    return _names(conn.execute(
+        "SELECT report_name FROM house_lords WHERE house = ? AND lord = ? ORDER BY report_name",
+        (int(house), clean_name(lord))))
+
+
+def reports_with_shadbala_at_least(conn, planet, minimum):
+    return _names(conn.execute(
+        "SELECT report_name FROM shadbala WHERE planet = ? AND pinda >= ? ORDER BY report_name",
+        (clean_name(planet), float(minimum))))
+
+
+def reports_with_current_mahadasha(conn, planet):
+    """Uses the TM-001 snapshot captured when the report was generated"""
+    return _names(conn.execute(
+        "SELECT report_name FROM reports WHERE current_mahadasha = ? ORDER BY report_name",
+        (clean_name(planet),)))
+
+
+def reports_in_dasha_on(conn, planet, on_date, level="Mahadasha"):
+    """Reports whose TM-002 sequence has `planet` running at `level` on `on_date` (YYYY-MM-DD)"""
+    if isinstance(on_date, datetime):
+        on_date = on_date.strftime("%Y-%m-%d")
+    return _names(conn.execute(
+        "SELECT DISTINCT report_name FROM dasha_periods "
+        "WHERE level = ? AND planet = ? AND start <= ? AND end > ? ORDER BY report_name",
+        (level, clean_name(planet), str(on_date), str(on_date))))
+
+
+def reports_with_dasha_starting_between(conn, start_date, end_date, level="Mahadasha", planet=None):
+    """Returns (report_name, planet, start) for periods beginning in [start_date, end_date)"""
+    sql = "SELECT report_name, planet, start FROM dasha_periods WHERE level = ? AND start >= ? AND start < ?"
+    params = [level, str(start_date), str(end_date)]
+    if planet is not None:
+        sql += " AND planet = ?"
+        params.append(clean_name(planet))
+    sql += " ORDER BY start, report_name"
+    return [tuple(row) for row in conn.execute(sql, params)]
+
+
+def reports_with_transit_in_house(conn, planet, house):
+    return _names(conn.execute(
+        "SELECT report_name FROM transits WHERE planet = ? AND house = ? ORDER BY report_name",
+        (clean_name(planet), int(house))))
+
+
+def reports_in_sade_sati(conn, phase=None):
+    if phase is None:
+        return _names(conn.execute(
+            "SELECT report_name FROM sade_sati WHERE is_active = 1 ORDER BY report_name"))
+    return _names(conn.execute(
+        "SELECT report_name FROM sade_sati WHERE is_active = 1 AND phase = ? ORDER BY report_name",
+        (phase,)))
+
+
+ZODIAC = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
+
+
+def reports_entering_sade_sati(conn, saturn_next_sign):
+    """
+    Sign-based approximation: reports not yet in Sade Sati that enter it when Saturn moves
+    into `saturn_next_sign`, whenever that is. Same relative-sign rule as transit.py: Rising
+    starts when Saturn is 12th from the natal Moon. Use reports_entering_sade_sati_between()
+    for a date range.
+    """
+    moon_sign = ZODIAC[(ZODIAC.index(saturn_next_sign) + 1) % 12]
+    return _names(conn.execute(
+        "SELECT r.report_name FROM reports r LEFT JOIN sade_sati s ON s.report_name = r.report_name "
+        "WHERE COALESCE(s.is_active, 0) = 0 AND r.moon_sign = ? ORDER BY r.report_name",
+        (moon_sign,)))
+
+
+def store_saturn_ingresses(conn, ingresses):
+    """
+    Saves Saturn's sign-entry dates as (entry YYYY-MM-DD, sign) pairs. Transits are the same
+    for every report, so they are stored once rather than per report; prediction.find_ingresses()
+    produces them.
+    """
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO saturn_ingresses VALUES (?, ?)",
+                         [(str(entry)[:10], clean_name(sign)) for entry, sign in ingresses])
+
+
+def reports_entering_sade_sati_between(conn, start_date, end_date):
+    """
+    Returns (report_name, entry date) for reports not yet in Sade Sati whose Rising phase
+    starts in [start_date, end_date), i.e. Saturn enters the 12th sign from their natal Moon.
+    Needs the saturn_ingresses table filled by store_saturn_ingresses().
+    """
+    ingresses = conn.execute(
+        "SELECT entry, sign FROM saturn_ingresses WHERE entry >= ? AND entry < ? ORDER BY entry",
+        (str(start_date)[:10], str(end_date)[:10])).fetchall()
+    results = []
+    for entry, sign in ingresses:
+        moon_sign = ZODIAC[(ZODIAC.index(sign) + 1) % 12]
+        for name in _names(conn.execute(
+                "SELECT r.report_name FROM reports r LEFT JOIN sade_sati s ON s.report_name = r.report_name "
+                "WHERE COALESCE(s.is_active, 0) = 0 AND r.moon_sign = ? ORDER BY r.report_name",
+                (moon_sign,))):
+            results.append((name, entry))
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    directory = sys.argv[1] if len(sys.argv) > 1 else "."
+    conn = open_index("report_index.db")
+    indexed, skipped, failed = index_directory(conn, directory)
+
+    print(f"--- Index Complete ---")
+    print(f"Indexed: {len(indexed)} | Unchanged: {len(skipped)} | Failed: {len(failed)}")
+    for f in failed:
+        print(f"  {f['Report']}: {f['Reason']}")
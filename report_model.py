@@ -0,0 +1,311 @@
+import ast
+from enum import IntEnum
+from dataclasses import dataclass, field
+
+# Typed result layer for the report builders. Planets and signs are enum-coded and every
+# record is a slotted dataclass built straight from AllPlanetData / AllHouseData payloads.
+# to_legacy_*() reproduces the JSON shape the builders have always written (stringified
+# lords, "PlanetName.Sun" keys, ...) while to_compact() / from_compact() give a small
+# int/float-only form for batch mode and caches.
+#
+# Built with keep_raw=True (what static.py does for its JSON output) every record also keeps
+# the library's original string, so the legacy output is byte-for-byte what str(payload)
+# always gave. Batch callers that only need the typed values build with keep_raw=False.
+
+
+class Planet(IntEnum):
+    Sun = 0
+    Moon = 1
+    Mars = 2
+    Mercury = 3
+    Jupiter = 4
+    Venus = 5
+    Saturn = 6
+    Rahu = 7
+    Ketu = 8
+
+    @classmethod
+    def parse(cls, value):
+        """Accepts a Planet, 'Sun', 'PlanetName.Sun' or a VedAstro PlanetName enum"""
+        if isinstance(value, cls):
+            return value
+        return cls[str(value).split('.')[-1]]
+
+    @property
+    def legacy_key(self):
+        return f"PlanetName.{self.name}"
+
+
+class Sign(IntEnum):
+    Aries = 0
+    Taurus = 1
+    Gemini = 2
+    Cancer = 3
+    Leo = 4
+    Virgo = 5
+    Libra = 6
+    Scorpio = 7
+    Sagittarius = 8
+    Capricorn = 9
+    Aquarius = 10
+    Pisces = 11
+
+    @classmethod
+    def parse(cls, value):
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            value = value.get("Name")
+        return cls[str(value).split('.')[-1]]
+
+
+SHADBALA_PLANETS = [Planet.Sun, Planet.Moon, Planet.Mars, Planet.Mercury, Planet.Jupiter, Planet.Venus, Planet.Saturn]
+
+VARGA_KEYS = {
+    "D9": "PlanetNavamshaD9Sign",
+    "D10": "PlanetDashamamshaD10Sign",
+    "D12": "PlanetDwadashamshaD12Sign",
+    "D30": "PlanetTrimshamshaD30Sign",
+}
+
+
+def degree_minute_second(degrees):
+    """1.4975 -> "1° 29' 51" (same rounding as VedAstro's DegreeMinuteSecond)"""
+    total_seconds = round(float(degrees) * 3600)
+    d, rem = divmod(total_seconds, 3600)
+    m, s = divmod(rem, 60)
+    return f"{d}° {m}' {s}"
+
+
+def parse_sign_payload(payload):
+    """
+    {'Name': 'Virgo', 'DegreesIn': {'TotalDegrees': '1.4975', ...}} -> (Sign, degrees).
+    The sign is None when the name is missing or not a zodiac sign.
+    """
+    if isinstance(payload, str):
+        payload = ast.literal_eval(payload)
+    try:
+        sign = Sign.parse(payload["Name"])
+    except KeyError:
+        sign = None
+    return sign, float(payload.get("DegreesIn", {}).get("TotalDegrees", 0.0))
+
+
+def sign_code(sign):
+    """Compact code for an optional Sign (-1 = unknown)"""
+    return -1 if sign is None else int(sign)
+
+
+def sign_from_code(code):
+    return None if code < 0 else Sign(code)
+
+
+def sign_from_name(name):
+    try:
+        return Sign.parse(name)
+    except KeyError:
+        return None
+
+
+def parse_house(raw):
+    """'House4' / 4 / '4.0' -> 4 (0 when unknown, as the builders always did)"""
+    try:
+        return int(float(str(raw).replace("House", "").strip()))
+    except ValueError:
+        return 0
+
+
+@dataclass(slots=True)
+class SignPosition:
+    sign: Sign
+    degree: float
+    raw: str = None  # str() of the library payload, when kept
+
+    @classmethod
+    def from_payload(cls, payload, keep_raw=True):
+        """Tolerates payloads it can't parse as long as their raw string is kept"""
+        try:
+            sign, degree = parse_sign_payload(payload)
+        except (ValueError, SyntaxError, TypeError, AttributeError):
+            if not keep_raw:
+                raise
+            sign, degree = None, 0.0
+        return cls(sign, degree, str(payload) if keep_raw else None)
+
+    def to_legacy(self):
+        if self.raw is not None:
+            return self.raw
+        return str({
+            "Name": self.sign.name if self.sign is not None else "Unknown",
+            "DegreesIn": {"DegreeMinuteSecond": degree_minute_second(self.degree), "TotalDegrees": repr(self.degree)}
+        })
+
+
+@dataclass(slots=True)
+class PlanetPlacement:
+    planet: Planet
+    rasi: SignPosition
+    house: int
+    vargas: dict = field(default_factory=dict)  # "D9" -> SignPosition
+    shadbala: float = None
+    nakshatra: str = None
+    pada: int = None
+    shadbala_raw: object = None  # PlanetShadbalaPinda exactly as the library returned it, when kept
+    skipped_vargas: dict = field(default_factory=dict)  # "D30" -> reason, for varga payloads that didn't parse
+
+    @classmethod
+    def from_payload(cls, planet, p_data, varga_names=VARGA_KEYS, keep_raw=True):
+        """Builds a placement from one Calculate.AllPlanetData(planet, time) payload"""
+        # A missing D1 sign gives "Unknown" / 0.0 like the old builder did
+        sign, degree = parse_sign_payload(p_data.get("PlanetRasiD1Sign", {}))
+        vargas, skipped = {}, {}
+        for name, key in varga_names.items():
+            if key not in p_data:
+                continue
+            # One bad varga shouldn't cost the whole placement; it is stored as unknown and reported
+            try:
+                vargas[name] = SignPosition.from_payload(p_data[key], keep_raw)
+            except (ValueError, SyntaxError, TypeError, AttributeError) as e:
+                vargas[name] = SignPosition(None, 0.0)
+                skipped[name] = f"{type(e).__name__}: {e}"
+        shadbala = p_data.get("PlanetShadbalaPinda")
+        try:
+            shadbala_value = float(str(shadbala)) if shadbala is not None else None
+        except ValueError:
+            shadbala_value = None
+        return cls(
+            planet=Planet.parse(planet),
+            rasi=SignPosition(sign, degree),
+            house=parse_house(p_data.get("HousePlanetOccupiesBasedOnSign", "0")),
+            vargas=vargas,
+            shadbala=shadbala_value,
+            shadbala_raw=shadbala if keep_raw else None,
+            skipped_vargas=skipped,
+        )
+
+    def legacy_shadbala(self):
+        if self.shadbala_raw is not None:
+            return self.shadbala_raw
+        return str(self.shadbala) if self.shadbala is not None else None
+
+    def to_legacy(self):
+        """The ST-001_<Planet> block"""
+        sign_name = self.rasi.sign.name if self.rasi.sign is not None else "Unknown"
+        out = {"Sign": sign_name, "Degree": round(self.rasi.degree, 2), "House": self.house}
+        if self.nakshatra is not None:
+            out["Nakshatra"] = self.nakshatra
+            out["Pada"] = self.pada
+        return out
+
+
+@dataclass(slots=True)
+class HouseLord:
+    house: int
+    lord: Planet  # None when the payload has no recognisable lord
+    raw: str = None  # str() of the library's LordOfHouse value, when kept
+
+    @classmethod
+    def from_payload(cls, house, h_data, keep_raw=True):
+        """Builds from one Calculate.AllHouseData(HouseName.House<n>, time) payload"""
+        value = h_data.get("LordOfHouse", "Unknown")
+        raw = value
+        try:
+            if isinstance(value, str) and value.startswith("{"):
+                value = ast.literal_eval(value)
+            if isinstance(value, dict):
+                value = value["Name"]
+            lord = Planet.parse(value)
+        except (KeyError, ValueError, SyntaxError):
+            lord = None
+        return cls(house=int(house), lord=lord, raw=str(raw) if keep_raw else None)
+
+    def to_legacy(self):
+        if self.raw is not None:
+            return self.raw
+        return str({"Name": self.lord.name}) if self.lord is not None else "Unknown"
+
+
+@dataclass(slots=True)
+class StaticChart:
+    placements: list = field(default_factory=list)    # PlanetPlacement, in Planet order
+    house_lords: list = field(default_factory=list)   # HouseLord, houses 1-12
+
+    def placement(self, planet):
+        planet = Planet.parse(planet)
+        for p in self.placements:
+            if p.planet == planet:
+                return p
+        raise KeyError(planet.name)
+
+    # --- today's JSON shape ---
+
+    def to_legacy_house_lords(self):
+        return {f"H{h.house}": h.to_legacy() for h in self.house_lords}
+
+    def to_legacy_shadbala(self):
+        return {p.planet.legacy_key: p.legacy_shadbala() for p in self.placements
+                if p.planet in SHADBALA_PLANETS and p.legacy_shadbala() is not None}
+
+    def to_legacy_varga(self, varga_name):
+        out = []
+        for p in self.placements:
+            if varga_name not in p.vargas:
+                raise KeyError(f"{VARGA_KEYS.get(varga_name, varga_name)} missing from AllPlanetData")
+            out.append({"Planet": p.planet.legacy_key, "Sign": p.vargas[varga_name].to_legacy()})
+        return out
+
+    # --- compact form: nested lists of ints/floats, ~6x smaller than the legacy JSON ---
+
+    def to_compact(self):
+        return {
+            "P": [
+                [int(p.planet), sign_code(p.rasi.sign), p.rasi.degree, p.house, p.shadbala,
+                 {k: [sign_code(v.sign), v.degree] for k, v in p.vargas.items()}, p.nakshatra, p.pada]
+                for p in self.placements
+            ],
+            "L": [-1 if h.lord is None else int(h.lord) for h in sorted(self.house_lords, key=lambda h: h.house)],
+        }
+
+    @classmethod
+    def from_compact(cls, data):
+        placements = [
+            PlanetPlacement(
+                planet=Planet(planet), rasi=SignPosition(sign_from_code(sign), degree), house=house, shadbala=shadbala,
+                vargas={k: SignPosition(sign_from_code(v[0]), v[1]) for k, v in vargas.items()},
+                nakshatra=nakshatra, pada=pada,
+            )
+            for planet, sign, degree, house, shadbala, vargas, nakshatra, pada in data["P"]
+        ]
+        house_lords = [HouseLord(i + 1, None if lord < 0 else Planet(lord)) for i, lord in enumerate(data["L"])]
+        return cls(placements=placements, house_lords=house_lords)
+
+    @classmethod
+    def from_legacy(cls, static_foundation, varga_analysis=None, keep_raw=False):
+        """Re-hydrates a chart from an already written Static_Foundation / Varga_Analysis block"""
+        placements = {}
+        for key, value in static_foundation.items():
+            if key.startswith("ST-001_") and isinstance(value, dict):
+                planet = Planet.parse(key[len("ST-001_"):])
+                placements[planet] = PlanetPlacement(
+                    planet=planet, rasi=SignPosition(sign_from_name(value["Sign"]), float(value["Degree"])),
+                    house=int(value["House"]), nakshatra=value.get("Nakshatra"), pada=value.get("Pada"))
+
+        for key, value in static_foundation.get("ST-003_Shadbala", {}).items():
+            planet = Planet.parse(key)
+            if planet in placements:
+                placements[planet].shadbala = float(value)
+                placements[planet].shadbala_raw = value if keep_raw else None
+
+        name_by_uid = {"VG-001": "D9", "VG-002": "D10", "VG-003": "D12", "VG-004": "D30"}
+        for key, rows in (varga_analysis or {}).items():
+            varga_name = name_by_uid.get(key[:6])
+            for row in rows if varga_name else []:
+                planet = Planet.parse(row["Planet"])
+                if planet in placements:
+                    position = SignPosition(*parse_sign_payload(row["Sign"]))
+                    position.raw = row["Sign"] if keep_raw else None
+                    placements[planet].vargas[varga_name] = position
+
+        house_lords = [HouseLord.from_payload(key[1:], {"LordOfHouse": raw}, keep_raw)
+                       for key, raw in static_foundation.get("ST-002_House_Lords", {}).items()]
+        return cls(placements=sorted(placements.values(), key=lambda p: p.planet), house_lords=house_lords)
@@ -2,6 +2,9 @@ import json
 import traceback
 from datetime import datetime
 from vedastro import *
+from report_model import Planet, PlanetPlacement, HouseLord, StaticChart
+
+VARGA_UIDS = {"D9": "VG-001", "D10": "VG-002", "D12": "VG-003", "D30": "VG-004"}
 
 def clean_name(enum_str):
     """Converts 'PlanetName.Sun' to 'Sun'"""
@@ -17,7 +20,13 @@ def setup_vedastro_time(date_str, time_str, offset_str, lat, lon, city):
     geolocation = GeoLocation(city, lat, lon)
     return Time(combined_time_str, geolocation)
 
-def generate_astrology_data(config):
+def generate_astrology_data(config, return_chart=False):
+    """
+    Builds the static payload. With return_chart=True the typed report_model.StaticChart is
+    returned alongside it as (output, chart) and the stringified ST-001/002/003 and Varga
+    blocks are left out of `output` (chart.to_legacy_*() / to_compact() rebuild them on demand),
+    which is what batch callers should keep in memory.
+    """
     # Setup calculation times with Timezone offsets
     birth_time = setup_vedastro_time(
         config["birth_details"]["date_of_birth"],
@@ -75,31 +84,37 @@ def generate_astrology_data(config):
             return fallback_val
 
     # --- USER STORY 1: Static Foundation ---
-    
-    
-    def get_st001(planet_enum):
-        """The bulletproof logic confirmed by our diagnostic"""
-        raw_data = Calculate.AllPlanetData(planet_enum, birth_time)
-    
-        # Extract Sign & Degree
-        rasi_data = raw_data.get("PlanetRasiD1Sign", {})
-        sign_name = rasi_data.get("Name", "Unknown")
-        total_degrees = rasi_data.get("DegreesIn", {}).get("TotalDegrees", 0.0)
-    
-        # Extract & Clean House
-        raw_house = str(raw_data.get("HousePlanetOccupiesBasedOnSign", "0"))
-        clean_house = raw_house.replace("House", "").strip()
 
+    # One AllPlanetData / AllHouseData pull per planet / house, shared by every UID below.
+    # Results live in the typed report_model records and are serialized to the legacy JSON shape.
+    # The legacy output keeps the library's raw strings so it stays exactly what str(payload) gave.
+    chart = StaticChart()
+    placement_errors = {}
+    keep_raw = not return_chart
+
+    def emit(section, key, value):
+        if not return_chart:
+            output[section][key] = value
+
+    def get_placement(planet_enum):
+        p = Planet.parse(planet_enum)
+        if p in placement_errors:
+            raise placement_errors[p]
+        for placement in chart.placements:
+            if placement.planet == p:
+                return placement
         try:
-            house_num = int(float(clean_house))
-        except:
-            house_num = 0
-
-        return {
-            "Sign": str(sign_name),
-            "Degree": round(float(total_degrees), 2),
-            "House": house_num
-        }
+            placement = PlanetPlacement.from_payload(p, Calculate.AllPlanetData(planet_enum, birth_time), keep_raw=keep_raw)
+        except Exception as e:
+            placement_errors[p] = e
+            raise
+        for varga_name, reason in placement.skipped_vargas.items():
+            output["Audit_Log"]["Skipped_Calculations"].append({
+                "UID": f"{VARGA_UIDS[varga_name]}_{p.name}",
+                "Reason": reason
+            })
+        chart.placements.append(placement)
+        return placement
 
     # --- THE LOOP ---
     # Defining the list explicitly to avoid any PlanetName namespace issues
@@ -113,36 +128,29 @@ def generate_astrology_data(config):
         p_name = str(p).split('.')[-1] # Cleaner than clean_name if that was bugging
     
         # We use lambda p=p to 'freeze' the planet in the current loop iteration
-        output["Static_Foundation"][f"ST-001_{p_name}"] = safe_calc(f"ST-001_{p_name}", {"Sign": "Unknown", "Degree": 0.0, "House": 0}, lambda p=p: get_st001(p))
-
-
+        emit("Static_Foundation", f"ST-001_{p_name}", safe_calc(f"ST-001_{p_name}", {"Sign": "Unknown", "Degree": 0.0, "House": 0}, lambda p=p: get_placement(p).to_legacy()))
 
-
-    
-    
-    
     def get_st002():
-        lords = {}
         for i in range(1, 13):
             house_enum = getattr(HouseName, f"House{i}")
             # New API usage: pull the bulk dictionary for the house
             h_data = Calculate.AllHouseData(house_enum, birth_time)
-            lords[f"H{i}"] = str(h_data.get("LordOfHouse", "Unknown"))
-        return lords
+            chart.house_lords.append(HouseLord.from_payload(i, h_data, keep_raw=keep_raw))
+        return chart.to_legacy_house_lords()
     
-    output["Static_Foundation"]["ST-002_House_Lords"] = safe_calc("ST-002", {}, get_st002)
+    emit("Static_Foundation", "ST-002_House_Lords", safe_calc("ST-002", {}, get_st002))
 
     def get_st003():
         shadbala = {}
         for p in [PlanetName.Sun, PlanetName.Moon, PlanetName.Mars, PlanetName.Mercury, PlanetName.Jupiter, PlanetName.Venus, PlanetName.Saturn]:
-             p_data = Calculate.AllPlanetData(p, birth_time)
-             if "PlanetShadbalaPinda" in p_data:
-                 shadbala[str(p)] = p_data["PlanetShadbalaPinda"]                 
+             placement = get_placement(p)
+             if placement.legacy_shadbala() is not None:
+                 shadbala[placement.planet.legacy_key] = placement.legacy_shadbala()
              else:
                  raise KeyError("ShadbalaPinda not found in AllPlanetData dictionary")
         return shadbala
     
-    output["Static_Foundation"]["ST-003_Shadbala"] = safe_calc("ST-003", {}, get_st003)
+    emit("Static_Foundation", "ST-003_Shadbala", safe_calc("ST-003", {}, get_st003))
     
     # Testing new BhinnashtakavargaChart API endpoint
     output["Static_Foundation"]["ST-004_Ashtakavarga_SAV"] = safe_calc("ST-004", {}, lambda: Calculate.BhinnashtakavargaChart(birth_time))
@@ -171,24 +179,21 @@ def generate_astrology_data(config):
 
 
     # --- USER STORY 2: Varga Analysis ---
-    # Attempting to fetch from AllPlanetData bulk payload
-    def get_vargas(varga_key):
-        varga_data = []
+    # Served from the same per-planet payloads as ST-001
+    def get_vargas(varga_name):
         for p in planets:
-            p_data = Calculate.AllPlanetData(p, birth_time)
-            if varga_key in p_data:
-                varga_data.append({"Planet": str(p), "Sign": str(p_data[varga_key])})
-            else:
-                raise KeyError(f"{varga_key} missing from AllPlanetData")
-        return varga_data
+            get_placement(p)
+        return chart.to_legacy_varga(varga_name)
 
-    output["Varga_Analysis"]["VG-001_D9_Navamsha"] = safe_calc("VG-001", [], lambda: get_vargas("PlanetNavamshaD9Sign"))
-    output["Varga_Analysis"]["VG-002_D10_Dashamsha"] = safe_calc("VG-002", [], lambda: get_vargas("PlanetDashamamshaD10Sign"))
-    output["Varga_Analysis"]["VG-003_D12_Dwadasamsha"] = safe_calc("VG-003", [], lambda: get_vargas("PlanetDwadashamshaD12Sign"))
-    output["Varga_Analysis"]["VG-004_D30_Trimshamsha"] = safe_calc("VG-004", [], lambda: get_vargas("PlanetTrimshamshaD30Sign"))
+    emit("Varga_Analysis", "VG-001_D9_Navamsha", safe_calc("VG-001", [], lambda: get_vargas("D9")))
+    emit("Varga_Analysis", "VG-002_D10_Dashamsha", safe_calc("VG-002", [], lambda: get_vargas("D10")))
+    emit("Varga_Analysis", "VG-003_D12_Dwadasamsha", safe_calc("VG-003", [], lambda: get_vargas("D12")))
+    emit("Varga_Analysis", "VG-004_D30_Trimshamsha", safe_calc("VG-004", [], lambda: get_vargas("D30")))
 
 
 
+    if return_chart:
+        return output, chart
     return output
 if __name__ == "__main__":
     print("Initializing AI Astrologer Analytical Engine...")
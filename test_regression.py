@@ -0,0 +1,23 @@
+import os
+import json
+
+from regression import GOLDEN_DIR, diff_dasha_sequences
+
+with open(os.path.join(GOLDEN_DIR, "dasha_boundaries.json"), "r") as f:
+    FIXTURE = json.load(f)
+
+
+def test_dasha_boundaries_within_tolerance_match():
+    assert diff_dasha_sequences(FIXTURE["Expected"], FIXTURE["Within_Tolerance"], FIXTURE["Tolerance_Minutes"]) == []
+
+
+def test_dasha_boundary_outside_tolerance_is_reported():
+    diffs = diff_dasha_sequences(FIXTURE["Expected"], FIXTURE["Outside_Tolerance"], FIXTURE["Tolerance_Minutes"])
+    # Shifting one Start also moves the previous period's End
+    assert sorted(d["Path"].rsplit(".", 1)[-1] for d in diffs) == ["End", "Start"]
+    assert all("off by 45 min" in d["Reason"] for d in diffs)
+
+
+def test_dasha_sequence_mismatch_is_reported():
+    diffs = diff_dasha_sequences(FIXTURE["Expected"], FIXTURE["Wrong_Sequence"], FIXTURE["Tolerance_Minutes"])
+    assert any(d["Reason"].startswith("Sequence") for d in diffs)
@@ -0,0 +1,47 @@
+import os
+
+from report_index import (dasha_period_rows, index_report, open_index, reports_entering_sade_sati_between,
+                          store_saturn_ingresses)
+
+REPORT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Report_User_03-09-1980_Lat30.44_Lon76.47.json")
+
+
+def test_dasha_period_rows_ends_last_period_of_each_level_at_horizon():
+    # Shape dasha.py writes: every End is the next entry's Start, only the last holds the horizon
+    sequence = [
+        {"Level": "Mahadasha", "Planet": "Mercury", "Start": "1993-01-01", "End": "1993-01-01"},
+        {"Level": "Antardasha", "Planet": "Ketu", "Parent": "Mercury", "Start": "1993-01-01", "End": "2010-01-01"},
+        {"Level": "Mahadasha", "Planet": "Saturn", "Start": "2010-01-01", "End": "2010-01-01"},
+        {"Level": "Antardasha", "Planet": "Saturn", "Parent": "Saturn", "Start": "2010-01-01", "End": "2013-01-01"},
+        {"Level": "Antardasha", "Planet": "Mercury", "Parent": "Saturn", "Start": "2013-01-01", "End": "2034-10-19"},
+    ]
+    rows = dasha_period_rows(sequence)
+
+    assert rows[0] == ("Mahadasha", "Mercury", None, "1993-01-01", "2010-01-01")
+    assert rows[1][4] == "2010-01-01"
+    assert rows[2] == ("Mahadasha", "Saturn", None, "2010-01-01", "2034-10-19")
+    assert rows[3][4] == "2013-01-01"
+    assert rows[4] == ("Antardasha", "Mercury", "Saturn", "2013-01-01", "2034-10-19")
+
+
+def test_dasha_period_rows_caps_antardasha_at_its_mahadasha():
+    sequence = [
+        {"Level": "Mahadasha", "Planet": "Venus", "Start": "2000-01-01", "End": "2000-01-01"},
+        {"Level": "Antardasha", "Planet": "Ketu", "Parent": "Venus", "Start": "2019-01-01", "End": "2020-01-01"},
+        {"Level": "Mahadasha", "Planet": "Sun", "Start": "2020-01-01", "End": "2026-01-01"},
+    ]
+    rows = dasha_period_rows(sequence)
+
+    assert rows[1][4] == "2020-01-01"
+    assert rows[2][4] == "2026-01-01"
+    assert dasha_period_rows([]) == []
+
+
+def test_reports_entering_sade_sati_between_uses_saturn_ingress_dates():
+    # The checked-in report has its natal Moon in Taurus and no active Sade Sati
+    conn = open_index(":memory:")
+    index_report(conn, REPORT)
+    store_saturn_ingresses(conn, [("2027-06-03", "Aries"), ("2029-08-08", "Taurus")])
+
+    assert reports_entering_sade_sati_between(conn, "2027-06-01", "2027-07-01") == [(os.path.basename(REPORT), "2027-06-03")]
+    assert reports_entering_sade_sati_between(conn, "2029-08-01", "2029-09-01") == []
@@ -20,9 +20,10 @@ def setup_vedastro_time(date_str, time_str, offset_str, lat, lon, city):
         o = f"{o[0]}0{o[1:]}"
     return Time(f"{t} {d} {o}", GeoLocation(str(city), float(lat), float(lon)))
 
-def run_transit_audit():
-    with open("config.json", "r") as f:
-        config = json.load(f)
+def run_transit_audit(config=None):
+    if config is None:
+        with open("config.json", "r") as f:
+            config = json.load(f)
 
     skipped_calculations = []
     Calculate.Ayanamsa = Ayanamsa.Lahiri
@@ -0,0 +1,267 @@
+import os
+import sys
+import time
+import runpy
+import argparse
+import threading
+import functools
+from collections import defaultdict
+
+# Opt-in call-level profiling of the VedAstro bridge. enable() wraps every public
+# Calculate method plus the Time and GeoLocation __init__; disable() puts the
+# originals back. Nothing is patched until enable() runs, so the normal code path
+# pays no overhead at all.
+#
+#   python vedastro_profiler.py static.py                 # profile a whole builder script
+#   python vedastro_profiler.py dasha.py --collapsed dasha.collapsed
+#
+# Each call is attributed to the UID of the enclosing safe_calc(uid, ...) frame (or to
+# the calling function for scripts without safe_calc) and recorded as a collapsed stack
+# "<python frames>;UID:<uid>;Calculate.<Method>(<arg types>) <microseconds>" that
+# flamegraph.pl / speedscope can load directly.
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_INHERITED = object()
+_abspaths = {}
+
+
+def _abspath(filename):
+    if filename not in _abspaths:
+        _abspaths[filename] = os.path.abspath(filename)
+    return _abspaths[filename]
+
+
+class CallStats:
+    __slots__ = ("count", "total", "self_time", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.self_time = 0.0
+        self.max = 0.0
+
+
+class VedAstroProfiler:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.originals = []          # (owner, attribute name, original value)
+        self.wrappers = {}           # id(subclass) -> (subclass, original class) for module-level swaps
+        self.by_call = defaultdict(CallStats)     # (method, arg shape) -> stats
+        self.by_uid = defaultdict(CallStats)      # uid -> stats of top-level library calls
+        self.stacks = defaultdict(float)          # collapsed stack -> self microseconds
+        self.library_time = 0.0
+        self.enabled = False
+
+    # --- patching ---
+
+    def enable(self):
+        if self.enabled:
+            return
+        import vedastro
+
+        for name in dir(vedastro.Calculate):
+            if name.startswith("_"):
+                continue
+            original = getattr(vedastro.Calculate, name)
+            if callable(original):
+                self._patch(vedastro.Calculate, name, staticmethod(self._wrap(f"Calculate.{name}", original)))
+
+        for cls_name in ["Time", "GeoLocation"]:
+            cls = getattr(vedastro, cls_name)
+            # Wrapping __init__ keeps the class itself in place, so isinstance() checks and
+            # class attributes keep working in every module that imported it
+            try:
+                self._patch(cls, "__init__", self._wrap(cls_name, cls.__init__, method=True))
+                continue
+            except (TypeError, AttributeError):
+                pass
+            # Extension types (.NET classes) refuse new attributes: swap in a timing subclass instead.
+            # Builders use `from vedastro import *`, so the name also lives in every importing module.
+            # vedastro's own submodules keep the real class.
+            subclass = type(cls_name, (cls,), {"__init__": self._wrap(cls_name, cls.__init__, method=True),
+                                               "__module__": cls.__module__})
+            self.wrappers[id(subclass)] = (subclass, cls)
+            modules = [m for name, m in list(sys.modules.items())
+                       if m is not vedastro and not name.startswith("vedastro.") and getattr(m, cls_name, None) is cls]
+            for module in [vedastro] + modules:
+                self._patch(module, cls_name, subclass)
+        self.enabled = True
+
+    def disable(self):
+        for owner, name, original in reversed(self.originals):
+            if original is _INHERITED:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        # Modules imported while profiling ran `from vedastro import *` against the patched
+        # module and hold their own reference to the timing subclass; swap those back too
+        if self.wrappers:
+            for module in list(sys.modules.values()):
+                try:
+                    attrs = list(vars(module).items())
+                except TypeError:
+                    continue
+                for name, value in attrs:
+                    entry = self.wrappers.get(id(value))
+                    if entry is not None and entry[0] is value:
+                        setattr(module, name, entry[1])
+        self.originals = []
+        self.wrappers = {}
+        self.enabled = False
+
+    def _patch(self, owner, name, value):
+        # Keep the raw class attribute (staticmethod / inherited) so disable() restores it exactly
+        original = vars(owner).get(name, _INHERITED) if isinstance(owner, type) else getattr(owner, name)
+        setattr(owner, name, value)
+        self.originals.append((owner, name, original))
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc):
+        self.disable()
+        return False
+
+    # --- recording ---
+
+    def _wrap(self, label, func, method=False):
+        """`method`: func takes self first, which is left out of the recorded argument shape"""
+        profiler = self
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            frames = getattr(profiler.local, "frames", None)
+            if frames is None:
+                frames = profiler.local.frames = []
+            shape = ",".join(type(a).__name__ for a in (args[1:] if method else args))
+            frames.append(0.0)  # child time accumulator
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                child = frames.pop()
+                if frames:
+                    frames[-1] += elapsed
+                profiler._record(label, shape, elapsed, elapsed - child, top_level=not frames)
+
+        return wrapper
+
+    def _record(self, label, shape, elapsed, self_elapsed, top_level):
+        uid, python_stack = caller_context()
+        call_key = f"{label}({shape})"
+        stack = ";".join(python_stack + [f"UID:{uid}", call_key])
+
+        with self.lock:
+            stats = self.by_call[(label, shape)]
+            stats.count += 1
+            stats.total += elapsed
+            stats.self_time += self_elapsed
+            stats.max = max(stats.max, elapsed)
+            self.stacks[stack] += self_elapsed * 1e6
+            if top_level:
+                self.library_time += elapsed
+                u = self.by_uid[uid]
+                u.count += 1
+                u.total += elapsed
+                u.max = max(u.max, elapsed)
+
+    # --- export ---
+
+    def write_collapsed(self, path):
+        with open(path, "w") as f:
+            for stack, micros in sorted(self.stacks.items()):
+                f.write(f"{stack} {max(1, round(micros))}\n")
+
+    def summary(self, wall_time=None):
+        calls = sorted(self.by_call.items(), key=lambda kv: kv[1].total, reverse=True)
+        out = {
+            "Library_Time_s": round(self.library_time, 4),
+            "Calls": [
+                {"Call": f"{label}({shape})", "Count": s.count, "Total_s": round(s.total, 4),
+                 "Self_s": round(s.self_time, 4), "Mean_ms": round(s.total / s.count * 1000, 3), "Max_ms": round(s.max * 1000, 3)}
+                for (label, shape), s in calls
+            ],
+            "By_UID": [
+                {"UID": uid, "Count": s.count, "Library_s": round(s.total, 4)}
+                for uid, s in sorted(self.by_uid.items(), key=lambda kv: kv[1].total, reverse=True)
+            ],
+        }
+        if wall_time is not None:
+            out["Wall_Time_s"] = round(wall_time, 4)
+            out["Python_Glue_s"] = round(wall_time - self.library_time, 4)
+        return out
+
+    def summary_table(self, wall_time=None):
+        s = self.summary(wall_time)
+        lines = []
+        if wall_time is not None:
+            share = s["Library_Time_s"] / wall_time * 100 if wall_time else 0.0
+            lines.append(f"Wall {s['Wall_Time_s']:.3f}s | VedAstro {s['Library_Time_s']:.3f}s ({share:.1f}%) | Python glue {s['Python_Glue_s']:.3f}s")
+            lines.append("")
+        lines.append(f"{'Call':<60} {'Count':>7} {'Total s':>9} {'Self s':>9} {'Mean ms':>9} {'Max ms':>9}")
+        for c in s["Calls"]:
+            lines.append(f"{c['Call'][:60]:<60} {c['Count']:>7} {c['Total_s']:>9.3f} {c['Self_s']:>9.3f} {c['Mean_ms']:>9.2f} {c['Max_ms']:>9.2f}")
+        lines.append("")
+        lines.append(f"{'UID':<30} {'Calls':>7} {'VedAstro s':>11}")
+        for u in s["By_UID"]:
+            lines.append(f"{u['UID']:<30} {u['Count']:>7} {u['Library_s']:>11.3f}")
+        return "\n".join(lines)
+
+
+def caller_context():
+    """
+    (uid, python frames) for the current library call. The UID comes from the nearest
+    safe_calc(uid, ...) frame; without one it is the innermost repo function name.
+    Frames are repo-local function names, outermost first.
+    """
+    uid = None
+    python_stack = []
+    frame = sys._getframe(3)  # skip caller_context, _record, wrapper
+    while frame is not None:
+        code = frame.f_code
+        filename = _abspath(code.co_filename)
+        if filename.startswith(REPO_DIR) and filename != _abspath(__file__):
+            if uid is None and code.co_name == "safe_calc":
+                uid = str(frame.f_locals.get("uid", "unknown"))
+            elif code.co_name != "<lambda>":
+                python_stack.append(f"{os.path.basename(filename)}:{code.co_name}")
+        frame = frame.f_back
+    python_stack.reverse()
+    if uid is None:
+        uid = python_stack[-1].split(":")[-1] if python_stack else "unknown"
+    return uid, python_stack
+
+
+profiler = VedAstroProfiler()
+
+
+def enable():
+    profiler.enable()
+
+
+def disable():
+    profiler.disable()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile every VedAstro call made by a builder script")
+    parser.add_argument("script", help="e.g. static.py, dasha.py, transit.py")
+    parser.add_argument("--collapsed", default="vedastro_profile.collapsed", help="flamegraph collapsed-stack output")
+    args = parser.parse_args()
+
+    # Patching happens before the script runs, so its `from vedastro import *` picks up the wrapped names
+    profiler.enable()
+    start = time.perf_counter()
+    try:
+        runpy.run_path(args.script, run_name="__main__")
+    finally:
+        wall = time.perf_counter() - start
+        profiler.disable()
+        profiler.write_collapsed(args.collapsed)
+        print(profiler.summary_table(wall))
+        print(f"\nCollapsed stacks saved to {args.collapsed}")